@@ -3,9 +3,17 @@ import os
 
 
 def main():
-    # Initialize dashboard with default settings
+    # Initialize dashboard with default settings. Set FEED_URL to point the
+    # stream at a local replay server (python -m src.Data_feed.replay), and
+    # HISTORY_SIZE to chart more than the default 200 points (e.g. 86400 for
+    # a day of 1 s prices; the chart is downsampled to fit).
     dashboard = CryptoPriceDashboard2(
-        symbol="BTC-USD", short_window=10, long_window=50, investment_amount=1000
+        symbol="BTC-USD",
+        short_window=10,
+        long_window=50,
+        investment_amount=1000,
+        feed_url=os.environ.get("FEED_URL"),
+        history_size=int(os.environ.get("HISTORY_SIZE", 0)) or None,
     )
 
     # Run the dashboard
@@ -2,7 +2,6 @@ import websocket
 import json
 import threading
 import time
-from collections import deque
 import logging
 from threading import Event
 from logging.handlers import RotatingFileHandler
@@ -10,10 +9,85 @@ import gc
 import psutil
 import numpy as np
 from datetime import datetime
+from src.Data_feed.ring_buffer import RingBuffer
+from src.Data_feed.message_decoder import MessageDecoder, parse_time
+from src.Data_feed.bar_aggregator import BarAggregator
+from src.Data_feed.snapshot import PriceSnapshot
+
+DEFAULT_FEED_URL = "wss://ws-feed.exchange.coinbase.com"
+
+
+class ProductState:
+    """Price history and aggregation state for a single product.
+
+    Writes are versioned seqlock-style: the version is odd while prices and
+    times are being mutated. Readers never lock; snapshot() copies both
+    series and retries if the version moved underneath it.
+    """
+
+    def __init__(self, product_id, buffer_size, bar_intervals=(1,)):
+        self.product_id = product_id
+        self.price_times = RingBuffer(buffer_size, dtype=np.int64)
+        self.prices = RingBuffer(buffer_size, dtype=np.float64)
+        self.bars = {interval: BarAggregator(interval) for interval in bar_intervals}
+        self.volume_30d = 0.0  # Latest 30-day volume from the ticker
+
+        self.version = 0
+        self._write_lock = threading.Lock()  # Serializes writers only
+        self._snapshot = None
+
+    def append(self, price, timestamp):
+        """Append one aggregated point as a single versioned write"""
+        with self._write_lock:
+            self.version += 1
+            try:
+                self.prices.append(price)
+                self.price_times.append(timestamp)
+            finally:
+                self.version += 1
+
+    def trim(self, size):
+        """Keep only the newest `size` points as a single versioned write"""
+        with self._write_lock:
+            self.version += 1
+            try:
+                self.prices.trim(size)
+                self.price_times.trim(size)
+            finally:
+                self.version += 1
+
+    def snapshot(self):
+        """Return a consistent PriceSnapshot without blocking writers"""
+        while True:
+            version = self.version
+            cached = self._snapshot
+            if cached is not None and cached.version == version:
+                return cached
+            if version & 1:
+                time.sleep(0)  # Writer mid-update; yield and retry
+                continue
+            prices = self.prices.last().copy()
+            times = self.price_times.last().copy()
+            total = self.prices.total
+            if self.version == version:
+                snapshot = PriceSnapshot(version, times, prices, total)
+                self._snapshot = snapshot
+                return snapshot
 
 
 class EnhancedCryptoStream:
-    def __init__(self, symbol="BTC-USD", max_retries=5, retry_delay=5):
+    def __init__(
+        self,
+        symbol="BTC-USD",
+        max_retries=5,
+        retry_delay=5,
+        symbols=None,
+        feed_url=DEFAULT_FEED_URL,
+        bar_intervals=(1, 5, 60),
+        aggregate_interval=1,
+        tick_writer=None,
+        history_size=None,
+    ):
         # Set up logging first
         logging.basicConfig(
             level=logging.WARNING,
@@ -28,8 +102,15 @@ class EnhancedCryptoStream:
         )
         self.logger = logging.getLogger(__name__)
 
-        # Basic configuration
-        self.symbol = symbol
+        # Basic configuration. A single stream can subscribe to many products
+        # over one connection; `symbol` stays the primary product for callers
+        # that only read one series.
+        self.symbols = list(dict.fromkeys(symbols)) if symbols else [symbol]
+        self.symbol = symbol if symbol in self.symbols else self.symbols[0]
+        self.products = {}
+
+        # Frame decoding: skip full JSON parsing for irrelevant frames
+        self.decoder = MessageDecoder(self.symbols)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_count = 0
@@ -38,16 +119,27 @@ class EnhancedCryptoStream:
         self.memory_threshold = 85  # Memory usage threshold (%)
         self.last_memory_check = time.time()
         self.memory_check_interval = 60  # Check memory every 60 seconds
+        # Aggregated points kept per product; None sizes the history from
+        # available memory (at most 200 points)
+        self.history_size = history_size
         self.cleanup_interval = 300  # Cleanup every 5 minutes
         self.last_cleanup = time.time()
 
-        # Data aggregation settings
-        self.price_buffer = []
-        self.buffer_size = 10
-        self.last_aggregate = time.time()
-        self.aggregate_interval = 1  # Aggregate every second
+        # Data aggregation settings: ticks are folded into OHLCV bars per
+        # interval (seconds); closes of the aggregate_interval bars feed the
+        # price history.
+        self.aggregate_interval = aggregate_interval  # Aggregate every second
+        self.bar_intervals = tuple(
+            dict.fromkeys((self.aggregate_interval,) + tuple(bar_intervals))
+        )
+        self.bar_listeners = []
+
+        # Optional persistence: decoded tickers are queued to a
+        # BackgroundWriter, so ingest never waits on disk
+        self.tick_writer = tick_writer
 
         # Connection management
+        self.feed_url = feed_url or DEFAULT_FEED_URL
         self.ws = None
         self.connected = Event()
         self.should_reconnect = True
@@ -64,18 +156,36 @@ class EnhancedCryptoStream:
         try:
             memory = psutil.virtual_memory()
             available_mb = memory.available / (1024 * 1024)
-            buffer_size = min(200, max(50, int(available_mb / 10)))
+            buffer_size = self.history_size or min(
+                200, max(50, int(available_mb / 10))
+            )
 
-            # Initialize data storage with adjusted size
-            self.price_times = deque(maxlen=buffer_size)
-            self.prices = deque(maxlen=buffer_size)
+            # Initialize per-product data storage with adjusted size
+            self.products = {
+                product_id: ProductState(product_id, buffer_size, self.bar_intervals)
+                for product_id in self.symbols
+            }
 
             self.logger.info(f"Buffer size adjusted to {buffer_size}")
         except Exception as e:
             self.logger.error(f"Error adjusting buffer sizes: {str(e)}")
             # Fallback to default sizes
-            self.price_times = deque(maxlen=200)
-            self.prices = deque(maxlen=200)
+            self.products = {
+                product_id: ProductState(
+                    product_id, self.history_size or 200, self.bar_intervals
+                )
+                for product_id in self.symbols
+            }
+
+    @property
+    def prices(self):
+        """Price history of the primary symbol"""
+        return self.products[self.symbol].prices
+
+    @property
+    def price_times(self):
+        """Price timestamps of the primary symbol"""
+        return self.products[self.symbol].price_times
 
     def check_memory_usage(self):
         """Monitor and manage memory usage"""
@@ -95,14 +205,8 @@ class EnhancedCryptoStream:
         try:
             gc.collect()
             # Reduce buffer sizes
-            new_size = int(len(self.prices) * 0.7)
-            self.prices = deque(
-                list(self.prices)[-new_size:], maxlen=self.prices.maxlen
-            )
-            self.price_times = deque(
-                list(self.price_times)[-new_size:], maxlen=self.price_times.maxlen
-            )
-            self.price_buffer = []
+            for state in self.products.values():
+                state.trim(int(len(state.prices) * 0.7))
             self.logger.info("Emergency cleanup completed")
         except Exception as e:
             self.logger.error(f"Emergency cleanup error: {str(e)}")
@@ -113,32 +217,44 @@ class EnhancedCryptoStream:
         if current_time - self.last_cleanup >= self.cleanup_interval:
             try:
                 gc.collect()
-                if len(self.prices) > self.prices.maxlen * 0.8:
-                    retain_size = int(self.prices.maxlen * 0.7)
-                    self.prices = deque(
-                        list(self.prices)[-retain_size:], maxlen=self.prices.maxlen
-                    )
-                    self.price_times = deque(
-                        list(self.price_times)[-retain_size:],
-                        maxlen=self.price_times.maxlen,
-                    )
+                for state in self.products.values():
+                    if len(state.prices) > state.prices.maxlen * 0.8:
+                        state.trim(int(state.prices.maxlen * 0.7))
                 self.last_cleanup = current_time
             except Exception as e:
                 self.logger.error(f"Cleanup error: {str(e)}")
 
-    def aggregate_data(self):
-        """Aggregate buffered price data"""
-        if not self.price_buffer:
-            return
+    def aggregate_data(self, state, price, size, timestamp_ms):
+        """Fold one tick into every bar interval of a product"""
+        for interval, aggregator in state.bars.items():
+            bar = aggregator.update(price, size, timestamp_ms)
+            if bar is not None:
+                self.on_bar_close(state, interval, bar)
+
+    def on_bar_close(self, state, interval, bar):
+        """Record a closed bar and notify bar listeners"""
         try:
-            avg_price = float(np.mean(self.price_buffer))
-            current_time = int(time.time() * 1000)
-            self.prices.append(avg_price)
-            self.price_times.append(current_time)
-            self.price_buffer = []
+            if interval == self.aggregate_interval:
+                state.append(bar.close, bar.start)
+
+                # Log significant price changes
+                prices = state.prices
+                if len(prices) > 1:
+                    price_change = abs(prices[-1] - prices[-2]) / prices[-2] * 100
+                    if price_change > 1:
+                        self.logger.info(
+                            f"{state.product_id} price change: {price_change:.2f}%"
+                        )
+
+            for listener in self.bar_listeners:
+                listener(state.product_id, interval, bar)
         except Exception as e:
             self.logger.error(f"Aggregation error: {str(e)}")
 
+    def add_bar_listener(self, callback):
+        """Call callback(product_id, interval, bar) whenever a bar closes"""
+        self.bar_listeners.append(callback)
+
     def handle_connection_error(self):
         """Handle connection errors with exponential backoff"""
         if self.retry_count < self.max_retries:
@@ -170,29 +286,30 @@ class EnhancedCryptoStream:
 
     def on_message(self, ws, message):
         """Handle incoming messages with memory management"""
+        self.process_message(message)
+
+    def process_message(self, message):
+        """Decode one raw feed frame and update the product state"""
         try:
-            data = json.loads(message)
-            if data.get("type") == "ticker" and data.get("product_id") == self.symbol:
+            msg_type, data = self.decoder.decode(message)
+            if data is not None:
+                state = self.products.get(data.get("product_id"))
+                if state is None:
+                    return
+                if self.tick_writer is not None:
+                    self.tick_writer.submit(data)
+                volume_30d = data.get("volume_30d")
+                if volume_30d:
+                    state.volume_30d = float(volume_30d)
                 price = float(data.get("price", 0))
-                self.price_buffer.append(price)
-
-                current_time = time.time()
-                if (
-                    len(self.price_buffer) >= self.buffer_size
-                    or current_time - self.last_aggregate >= self.aggregate_interval
-                ):
-                    self.aggregate_data()
-                    self.last_aggregate = current_time
-
-                # Log significant price changes
-                if len(self.prices) > 1:
-                    price_change = (
-                        abs(self.prices[-1] - self.prices[-2]) / self.prices[-2] * 100
-                    )
-                    if price_change > 1:
-                        self.logger.info(f"Price change: {price_change:.2f}%")
+                size = float(data.get("last_size") or 0)
+                trade_time = data.get("time")
+                timestamp_ms = int(
+                    (parse_time(trade_time) if trade_time else time.time()) * 1000
+                )
+                self.aggregate_data(state, price, size, timestamp_ms)
 
-            elif data.get("type") == "heartbeat":
+            elif msg_type == "heartbeat":
                 self.last_heartbeat = time.time()
 
         except json.JSONDecodeError as e:
@@ -220,12 +337,17 @@ class EnhancedCryptoStream:
         self.connected.set()
         self.retry_count = 0
 
-        subscribe_message = {
-            "type": "subscribe",
-            "product_ids": [self.symbol],
-            "channels": ["ticker", "heartbeat"],
-        }
-        ws.send(json.dumps(subscribe_message))
+        ws.send(self.subscribe_message())
+
+    def subscribe_message(self):
+        """Subscription frame for all products of this stream"""
+        return json.dumps(
+            {
+                "type": "subscribe",
+                "product_ids": self.symbols,
+                "channels": ["ticker", "heartbeat"],
+            }
+        )
 
     def reconnect(self):
         """Handle reconnection logic"""
@@ -243,7 +365,7 @@ class EnhancedCryptoStream:
         """Initialize WebSocket connection"""
         websocket.enableTrace(False)
         self.ws = websocket.WebSocketApp(
-            "wss://ws-feed.exchange.coinbase.com",
+            self.feed_url,
             on_open=self.on_open,
             on_message=self.on_message,
             on_error=self.on_error,
@@ -263,10 +385,33 @@ class EnhancedCryptoStream:
             self.ws.close()
         self.logger.info("Stream stopped")
 
-    def get_current_price(self):
-        """Safe method to get current price"""
-        return self.prices[-1] if self.prices else None
+    def snapshot(self, product_id=None):
+        """Consistent point-in-time copy of a product's prices and times"""
+        return self.products[product_id or self.symbol].snapshot()
 
-    def get_price_history(self):
-        """Safe method to get price history"""
-        return list(self.prices)
+    def get_bars(self, product_id=None, interval=None, n=None):
+        """Most recent closed bars of a product, oldest first"""
+        state = self.products.get(product_id or self.symbol)
+        if state is None:
+            return []
+        return state.bars[interval or self.aggregate_interval].last(n)
+
+    def get_current_price(self, product_id=None):
+        """Safe method to get current price"""
+        state = self.products.get(product_id or self.symbol)
+        if state is None or not state.prices:
+            return None
+        return state.prices[-1]
+
+    def get_volume_30d(self, product_id=None):
+        """Latest 30-day traded volume reported by the ticker (0 if unknown)"""
+        state = self.products.get(product_id or self.symbol)
+        return state.volume_30d if state is not None else 0.0
+
+    def get_price_history(self, product_id=None, n=None):
+        """Safe method to get price history as a read-only array"""
+        state = self.products.get(product_id or self.symbol)
+        if state is None:
+            return np.empty(0, dtype=np.float64)
+        prices = state.snapshot().prices
+        return prices if n is None else prices[len(prices) - min(n, len(prices)) :]
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+from websockets.asyncio.client import connect
+
+from src.Data_feed.DataStream import EnhancedCryptoStream
+
+
+class AsyncCryptoStream(EnhancedCryptoStream):
+    """asyncio implementation of EnhancedCryptoStream.
+
+    Buffers, decoding and the public API (get_current_price,
+    get_price_history, stop) are inherited. The receive loop, reconnect
+    backoff, heartbeat watchdog and memory checks run as tasks on one event
+    loop instead of a websocket-client thread plus a health thread, so many
+    streams can share a single thread via run_streams().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.health_check_interval = 5
+        self._loop = None
+
+    async def run(self):
+        """Connect and consume the feed until stop() is called"""
+        self._loop = asyncio.get_running_loop()
+        tasks = [
+            asyncio.create_task(self._watch_heartbeat()),
+            asyncio.create_task(self._manage_memory()),
+        ]
+        try:
+            while self.should_reconnect:
+                try:
+                    async with connect(
+                        self.feed_url, ping_interval=30, ping_timeout=10
+                    ) as ws:
+                        self.ws = ws
+                        await self._on_open(ws)
+                        async for message in ws:
+                            self.process_message(message)
+                    self.logger.warning("WebSocket closed")
+                except Exception as e:
+                    self.logger.error(f"WebSocket error: {str(e)}")
+                finally:
+                    self.ws = None
+                    self.connected.clear()
+
+                if self.should_reconnect and not await self._backoff():
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def start_websocket(self):
+        """Blocking entry point matching EnhancedCryptoStream.start_websocket"""
+        asyncio.run(self.run())
+
+    def stop(self):
+        """Graceful shutdown, callable from any thread"""
+        self.should_reconnect = False
+        if self.ws is not None and self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self.ws.close(), self._loop)
+        self.logger.info("Stream stopped")
+
+    async def _on_open(self, ws):
+        """Subscribe once the connection is established"""
+        self.logger.info("WebSocket opened")
+        self.connected.set()
+        self.retry_count = 0
+        self.last_heartbeat = time.time()
+        await ws.send(self.subscribe_message())
+
+    async def _backoff(self):
+        """Exponential backoff between reconnects without blocking the loop"""
+        if self.retry_count < self.max_retries:
+            wait_time = self.retry_delay * (2**self.retry_count)
+            self.logger.warning(
+                f"Connection retry {self.retry_count + 1}/{self.max_retries}"
+            )
+            await asyncio.sleep(wait_time)
+            self.retry_count += 1
+            return True
+        self.logger.error("Max retries reached")
+        return False
+
+    async def _watch_heartbeat(self):
+        """Drop the connection when heartbeats stop so run() reconnects"""
+        while self.should_reconnect:
+            await asyncio.sleep(self.health_check_interval)
+            if time.time() - self.last_heartbeat > self.heartbeat_interval * 2:
+                self.logger.warning("Heartbeat timeout")
+                self.last_heartbeat = time.time()
+                if self.ws is not None:
+                    await self.ws.close()
+
+    async def _manage_memory(self):
+        """Periodic memory check and buffer cleanup"""
+        while self.should_reconnect:
+            await asyncio.sleep(self.health_check_interval)
+            self.check_memory_usage()
+            self.cleanup_old_data()
+
+
+async def run_streams(streams):
+    """Host many feeds on the current event loop"""
+    await asyncio.gather(*(stream.run() for stream in streams))
@@ -0,0 +1,112 @@
+from collections import deque
+from itertools import islice
+
+
+class Bar:
+    """OHLCV bar with VWAP inputs for one time bucket"""
+
+    __slots__ = (
+        "start",
+        "interval",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "notional",
+        "trade_count",
+    )
+
+    def __init__(self, start, interval, price, size):
+        self.start = start  # Bucket start, epoch ms
+        self.interval = interval  # Bucket length, ms
+        self.open = price
+        self.high = price
+        self.low = price
+        self.close = price
+        self.volume = size
+        self.notional = price * size
+        self.trade_count = 1
+
+    @property
+    def end(self):
+        """Bucket end, epoch ms (exclusive)"""
+        return self.start + self.interval
+
+    @property
+    def vwap(self):
+        """Volume-weighted average price, or the close when no volume traded"""
+        return self.notional / self.volume if self.volume > 0 else self.close
+
+    def to_dict(self):
+        """Plain dict representation for JSON/dashboard use"""
+        return {
+            "start": self.start,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "vwap": self.vwap,
+            "trade_count": self.trade_count,
+        }
+
+    def __repr__(self):
+        return (
+            f"Bar(start={self.start}, o={self.open}, h={self.high}, l={self.low}, "
+            f"c={self.close}, v={self.volume}, n={self.trade_count})"
+        )
+
+
+class BarAggregator:
+    """Incremental time-bucketed bar builder for one product and interval.
+
+    Each tick is folded into the open bar in O(1) with scalar updates only.
+    A bar closes when the first tick of a later bucket arrives, so bucket
+    boundaries follow the feed's event time rather than the wall clock.
+    """
+
+    def __init__(self, interval=1, history=500):
+        """
+        Args:
+            interval: Bar length in seconds (e.g. 1, 5, 60)
+            history: Number of closed bars to keep
+        """
+        self.interval = interval
+        self.interval_ms = int(interval * 1000)
+        if self.interval_ms <= 0:
+            raise ValueError("interval must be positive")
+        self.current = None
+        self.closed = deque(maxlen=history)
+
+    def update(self, price, size, timestamp_ms):
+        """
+        Fold one tick into the current bar.
+
+        Returns:
+            The bar this tick closed, or None
+        """
+        bar = self.current
+        if bar is not None and timestamp_ms < bar.start + self.interval_ms:
+            # Same bucket (late ticks are folded into the open bar)
+            if price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
+            bar.close = price
+            bar.volume += size
+            bar.notional += price * size
+            bar.trade_count += 1
+            return None
+
+        start = timestamp_ms - timestamp_ms % self.interval_ms
+        self.current = Bar(start, self.interval_ms, price, size)
+        if bar is not None:
+            self.closed.append(bar)
+        return bar
+
+    def last(self, n=None):
+        """Most recent closed bars, oldest first"""
+        if n is None or n >= len(self.closed):
+            return list(self.closed)
+        return list(islice(reversed(self.closed), n))[::-1]
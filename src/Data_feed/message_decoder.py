@@ -0,0 +1,220 @@
+import json
+import re
+import time
+from datetime import datetime
+
+# Fastest installed JSON backend first; stdlib json is always available
+JSON_BACKENDS = ("orjson", "ujson", "json")
+
+# Coinbase feed frames are flat objects, so the first "type"/"product_id"
+# keys in the raw text are the top-level ones. The compact key literal is
+# located with str.find; the regex only handles frames with extra whitespace.
+_TYPE_KEY = '"type":"'
+_PRODUCT_KEY = '"product_id":"'
+_TYPE_RE = re.compile(r'"type"\s*:\s*"([^"]*)"')
+_PRODUCT_RE = re.compile(r'"product_id"\s*:\s*"([^"]*)"')
+_TYPE_KEY_BYTES = b'"type":"'
+_PRODUCT_KEY_BYTES = b'"product_id":"'
+_TYPE_RE_BYTES = re.compile(rb'"type"\s*:\s*"([^"]*)"')
+_PRODUCT_RE_BYTES = re.compile(rb'"product_id"\s*:\s*"([^"]*)"')
+
+
+def _find_field(message, key, key_re, quote):
+    """Read a top-level string field from a raw frame without parsing it"""
+    start = message.find(key)
+    if start >= 0:
+        start += len(key)
+        return message[start : message.find(quote, start)]
+    match = key_re.search(message)
+    return match.group(1) if match else None
+
+
+def parse_time(value):
+    """Parse a feed ISO-8601 timestamp into epoch seconds"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def get_json_backend(name=None):
+    """Return (backend_name, loads) for the requested or fastest installed backend"""
+    candidates = (name,) if name else JSON_BACKENDS
+    for candidate in candidates:
+        if candidate == "json":
+            return "json", json.loads
+        try:
+            module = __import__(candidate)
+        except ImportError:
+            continue
+        return candidate, module.loads
+    raise ImportError(f"JSON backend '{name}' is not installed")
+
+
+def available_backends():
+    """Names of all JSON backends importable in this environment"""
+    names = []
+    for name in JSON_BACKENDS:
+        try:
+            get_json_backend(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+class MessageDecoder:
+    """Pre-filters raw feed frames before paying for a full JSON parse.
+
+    The message type and product are read from the raw frame text.
+    Only tickers for subscribed products are fully decoded; heartbeats,
+    subscription acks and other products' tickers are classified and
+    skipped.
+    """
+
+    def __init__(self, product_ids=None, backend=None, prefilter=True):
+        self.backend, self._loads = get_json_backend(backend)
+        self.product_ids = set(product_ids) if product_ids else None
+        self.prefilter = prefilter
+        self.product_ids_bytes = (
+            {p.encode() for p in self.product_ids} if self.product_ids else None
+        )
+
+    def decode(self, message):
+        """
+        Classify a raw frame and decode it if relevant.
+
+        Args:
+            message: Raw frame as str or bytes
+
+        Returns:
+            (msg_type, data) where data is the parsed ticker dict, or None if
+            the frame was skipped without a full parse.
+        """
+        if not self.prefilter:
+            data = self._loads(message)
+            msg_type = data.get("type")
+            if msg_type != "ticker" or (
+                self.product_ids is not None
+                and data.get("product_id") not in self.product_ids
+            ):
+                return msg_type, None
+            return msg_type, data
+
+        if type(message) is str:
+            # Inlined str fast path for compact frames
+            start = message.find(_TYPE_KEY)
+            if start >= 0:
+                start += len(_TYPE_KEY)
+                if message.startswith('ticker"', start):
+                    if self.product_ids is None:
+                        return "ticker", self._loads(message)
+                    start = message.find(_PRODUCT_KEY)
+                    if start >= 0:
+                        start += len(_PRODUCT_KEY)
+                        product_id = message[start : message.find('"', start)]
+                        if product_id in self.product_ids:
+                            return "ticker", self._loads(message)
+                        return "ticker", None
+                else:
+                    return message[start : message.find('"', start)], None
+
+        if isinstance(message, (bytes, bytearray)):
+            msg_type = _find_field(message, _TYPE_KEY_BYTES, _TYPE_RE_BYTES, b'"')
+            if msg_type is not None:
+                msg_type = msg_type.decode()
+            product_args = (_PRODUCT_KEY_BYTES, _PRODUCT_RE_BYTES, b'"')
+            products = self.product_ids_bytes
+        else:
+            msg_type = _find_field(message, _TYPE_KEY, _TYPE_RE, '"')
+            product_args = (_PRODUCT_KEY, _PRODUCT_RE, '"')
+            products = self.product_ids
+
+        if msg_type is None:
+            # Not a frame layout we recognise; let the full parser decide
+            data = self._loads(message)
+            return data.get("type"), None
+        if msg_type != "ticker":
+            return msg_type, None
+
+        if products is not None:
+            if _find_field(message, *product_args) not in products:
+                return msg_type, None
+
+        return msg_type, self._loads(message)
+
+
+def _sample_frames(count, product_ids=("BTC-USD",), other_ids=("ETH-USD", "SOL-USD")):
+    """Build a realistic mix of ticker and heartbeat frames"""
+    frames = []
+    all_ids = list(product_ids) + list(other_ids)
+    for i in range(count):
+        product_id = all_ids[i % len(all_ids)]
+        if i % 10 == 9:
+            frames.append(
+                json.dumps(
+                    {
+                        "type": "heartbeat",
+                        "last_trade_id": 729140450 + i,
+                        "product_id": product_id,
+                        "sequence": 90000000000 + i,
+                        "time": "2024-12-01T01:18:27.336497Z",
+                    },
+                    separators=(",", ":"),
+                )
+            )
+            continue
+        frames.append(
+            json.dumps(
+                {
+                    "type": "ticker",
+                    "sequence": 90000000000 + i,
+                    "product_id": product_id,
+                    "price": f"{96209.92 + i * 0.01:.2f}",
+                    "open_24h": "96461.07",
+                    "volume_24h": "3179.78852051",
+                    "low_24h": "96129.73",
+                    "high_24h": "97282.41",
+                    "volume_30d": "528964.9359838",
+                    "best_bid": "96209.91",
+                    "best_bid_size": "0.19682657",
+                    "best_ask": "96209.92",
+                    "best_ask_size": "0.02006329",
+                    "side": "buy",
+                    "time": "2024-12-01T01:18:27.336497Z",
+                    "trade_id": 729140450 + i,
+                    "last_size": "0.00019046",
+                },
+                separators=(",", ":"),
+            )
+        )
+    return frames
+
+
+def benchmark(count=200000, product_ids=("BTC-USD",)):
+    """Report messages/second for every backend with and without pre-filtering"""
+    frames = _sample_frames(count, product_ids)
+    results = []
+    for backend in available_backends():
+        for prefilter in (False, True):
+            decoder = MessageDecoder(product_ids, backend=backend, prefilter=prefilter)
+            decode = decoder.decode
+            start = time.perf_counter()
+            for frame in frames:
+                msg_type, data = decode(frame)
+                if data is not None:
+                    float(data["price"])
+            elapsed = time.perf_counter() - start
+            results.append(
+                {
+                    "backend": backend,
+                    "prefilter": prefilter,
+                    "messages_per_second": count / elapsed,
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for result in benchmark():
+        print(
+            f"{result['backend']:>7} prefilter={str(result['prefilter']):<5} "
+            f"{result['messages_per_second']:>12,.0f} msg/s"
+        )
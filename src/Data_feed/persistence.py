@@ -0,0 +1,213 @@
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+
+from CryptoDataModel import Ticker, CSV_HEADER
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("never", "flush", "interval")
+
+_STOP = object()
+
+
+class CsvTickerSink:
+    """Appends Ticker records to a CSV file in the ticker_data.csv schema.
+
+    Unlike Ticker.write_to_csv the file is opened once and kept open.
+    """
+
+    def __init__(self, filename="ticker_data.csv"):
+        self.filename = filename
+        self._file = open(filename, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(CSV_HEADER)
+
+    def write(self, records):
+        """Write a batch of Ticker instances or ticker message dicts"""
+        self._writer.writerows(
+            (
+                record if isinstance(record, Ticker) else Ticker.from_dict(record)
+            ).to_csv_row()
+            for record in records
+        )
+
+    def flush(self, fsync=False):
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+class TickStoreSink:
+    """Writes ticker message dicts into a TickStore"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def write(self, records):
+        for record in records:
+            self.store.append(record.get("product_id"), record)
+
+    def flush(self, fsync=False):
+        # Closing the segment files only hands the data to the OS; fsync
+        # makes the files written since the last sync durable
+        self.store.flush(fsync=fsync)
+
+    def close(self):
+        self.store.flush()
+
+
+class BackgroundWriter:
+    """Hands records to a sink on a background thread.
+
+    Producers call submit(), which never blocks: when the bounded queue is
+    full the record is dropped and counted. The writer thread batches
+    records and flushes when flush_size records are pending or
+    flush_interval seconds have passed, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        sink,
+        max_queue=10000,
+        flush_size=500,
+        flush_interval=1.0,
+        fsync_policy="interval",
+        fsync_interval=5.0,
+    ):
+        """
+        Args:
+            sink: Object with write(records), flush(fsync) and close()
+            max_queue: Maximum number of records waiting to be written
+            flush_size: Flush once this many records are batched
+            flush_interval: Flush at least this often (seconds)
+            fsync_policy: 'never', 'flush' (every flush) or 'interval'
+            fsync_interval: Seconds between fsyncs for the 'interval' policy
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of {FSYNC_POLICIES}")
+        self.sink = sink
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._last_fsync = time.monotonic()
+        self._written_since_fsync = False  # Sink holds data not yet fsynced
+
+        # Counters
+        self.submitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.errors = 0
+        self.flushes = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+        self.total_flush_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, record):
+        """Queue a record without blocking; returns False if it was dropped"""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def stats(self):
+        """Queue depth, flush latency (ms) and record counters"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_latency * 1000, 3),
+            "max_flush_ms": round(self.max_flush_latency * 1000, 3),
+            "avg_flush_ms": round(
+                self.total_flush_latency * 1000 / self.flushes if self.flushes else 0,
+                3,
+            ),
+        }
+
+    def close(self, timeout=5):
+        """Flush pending records, stop the thread and close the sink"""
+        self._queue.put(_STOP, timeout=timeout)
+        self._thread.join(timeout=timeout)
+        self.sink.close()
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                record = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                record = None
+
+            if record is _STOP:
+                self._flush(batch, final=True)
+                return
+            if record is not None:
+                batch.append(record)
+                # Drain whatever is already queued without waiting
+                while len(batch) < self.flush_size:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is _STOP:
+                        self._flush(batch, final=True)
+                        return
+                    batch.append(record)
+
+            if len(batch) >= self.flush_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch, final=False):
+        now = time.monotonic()
+        if self.fsync_policy == "flush":
+            fsync = True
+        elif self.fsync_policy == "interval":
+            fsync = final or now - self._last_fsync >= self.fsync_interval
+        else:
+            fsync = False
+        # An idle writer has nothing to flush or fsync
+        if not batch and not (fsync and self._written_since_fsync):
+            return
+
+        start = time.perf_counter()
+        try:
+            if batch:
+                self._written_since_fsync = True
+                self.sink.write(batch)
+            self.sink.flush(fsync=fsync)
+            self.written += len(batch)
+            if fsync:
+                self._written_since_fsync = False
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Persistence flush error: {str(e)}")
+        latency = time.perf_counter() - start
+
+        if fsync:
+            self._last_fsync = now
+        self.flushes += 1
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+        self.total_flush_latency += latency
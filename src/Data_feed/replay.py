@@ -0,0 +1,283 @@
+import argparse
+import asyncio
+import csv
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+from websockets.asyncio.server import serve
+
+from src.Data_feed.message_decoder import parse_time
+from src.Data_feed.tick_record import CSV_FIELDS
+
+
+def _encode(message):
+    """Serialize a frame compactly, the way the exchange sends it"""
+    return json.dumps(message, separators=(",", ":"))
+
+
+def load_jsonl(path):
+    """
+    Load recorded feed frames, one JSON message per line.
+
+    Returns:
+        List of (epoch_seconds, product_id, raw_frame) tuples in file order
+    """
+    messages = []
+    with open(path) as file:
+        for index, line in enumerate(file):
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            timestamp = parse_time(data["time"]) if data.get("time") else index
+            messages.append((timestamp, data.get("product_id"), _encode(data)))
+    return messages
+
+
+def load_ticker_csv(path):
+    """
+    Load ticker rows in the ticker_data.csv schema as ticker frames.
+
+    Returns:
+        List of (epoch_seconds, product_id, raw_frame) tuples in file order
+    """
+    messages = []
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)  # Header
+        for row in reader:
+            message = {"type": "ticker"}
+            message.update(zip(CSV_FIELDS, row))
+            if message.get("trade_id"):
+                message["trade_id"] = int(message["trade_id"])
+            messages.append(
+                (parse_time(message["time"]), message["product_id"], _encode(message))
+            )
+    return messages
+
+
+def load_recording(path):
+    """Load a recording, picking the reader from the file extension"""
+    if str(path).lower().endswith(".csv"):
+        return load_ticker_csv(path)
+    return load_jsonl(path)
+
+
+class ReplayServer:
+    """Local websocket stand-in for the exchange feed.
+
+    Speaks the subset of the Coinbase protocol EnhancedCryptoStream uses:
+    it waits for a subscribe message, acknowledges it, sends heartbeats
+    and replays the recorded tickers of the subscribed products.
+    """
+
+    def __init__(
+        self, messages, host="127.0.0.1", port=0, speed=1.0, heartbeat_interval=1
+    ):
+        """
+        Args:
+            messages: (epoch_seconds, product_id, raw_frame) tuples
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            speed: Playback rate: 1 = real time, N = N times faster,
+                None = as fast as the client reads
+            heartbeat_interval: Seconds between heartbeat frames
+        """
+        self.messages = messages
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self.heartbeat_interval = heartbeat_interval
+
+        self.url = None
+        self.sent_times = []  # perf_counter() of every replayed ticker
+        self.finished = threading.Event()
+        self._ready = threading.Event()
+        self._loop = None
+        self._stop = None
+        self._thread = None
+
+    def start(self):
+        """Start serving on a background thread and return the feed URL"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10):
+            raise TimeoutError("Replay server failed to start")
+        return self.url
+
+    def stop(self):
+        """Stop the server and wait for its thread"""
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        async with serve(self._handler, self.host, self.port) as server:
+            port = server.sockets[0].getsockname()[1]
+            self.url = f"ws://{self.host}:{port}"
+            self._ready.set()
+            await self._stop.wait()
+
+    async def _heartbeat(self, connection, product_ids):
+        sequence = 0
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            sequence += 1
+            for product_id in product_ids:
+                await connection.send(
+                    _encode(
+                        {
+                            "type": "heartbeat",
+                            "product_id": product_id,
+                            "sequence": sequence,
+                            "time": datetime.now(timezone.utc).strftime(
+                                "%Y-%m-%dT%H:%M:%S.%fZ"
+                            ),
+                        }
+                    )
+                )
+
+    async def _handler(self, connection):
+        subscription = json.loads(await connection.recv())
+        product_ids = subscription.get("product_ids") or []
+        channels = subscription.get("channels") or []
+        await connection.send(
+            _encode(
+                {
+                    "type": "subscriptions",
+                    "channels": [
+                        {"name": name, "product_ids": product_ids} for name in channels
+                    ],
+                }
+            )
+        )
+
+        heartbeat = None
+        if "heartbeat" in channels:
+            heartbeat = asyncio.create_task(self._heartbeat(connection, product_ids))
+
+        try:
+            wanted = set(product_ids)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            first_timestamp = self.messages[0][0] if self.messages else 0
+            for timestamp, product_id, frame in self.messages:
+                if product_id not in wanted:
+                    continue
+                if self.speed:
+                    delay = start + (timestamp - first_timestamp) / self.speed
+                    delay -= loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                self.sent_times.append(time.perf_counter())
+                await connection.send(frame)
+            self.finished.set()
+            await connection.wait_closed()
+        finally:
+            if heartbeat:
+                heartbeat.cancel()
+
+
+def measure_ingest(path, speed=None, symbols=None, timeout=120):
+    """
+    Replay a recording through a real EnhancedCryptoStream and time it.
+
+    Latency is measured per ticker from the moment the server hands the frame
+    to the socket until the stream's on_message returns.
+
+    Returns:
+        Dict with message count, throughput and latency percentiles (ms)
+    """
+    from src.Data_feed.DataStream import EnhancedCryptoStream
+
+    messages = load_recording(path)
+    if symbols is None:
+        symbols = sorted({product_id for _, product_id, _ in messages if product_id})
+    expected = sum(1 for _, product_id, _ in messages if product_id in symbols)
+
+    server = ReplayServer(messages, speed=speed)
+    url = server.start()
+
+    stream = EnhancedCryptoStream(symbol=symbols[0], symbols=symbols, feed_url=url)
+    received_times = []
+    on_message = stream.on_message
+
+    def timed_on_message(ws, message):
+        on_message(ws, message)
+        if '"type":"ticker"' in message:
+            received_times.append(time.perf_counter())
+
+    stream.on_message = timed_on_message
+    thread = threading.Thread(target=stream.start_websocket, daemon=True)
+    thread.start()
+
+    deadline = time.time() + timeout
+    while len(received_times) < expected and time.time() < deadline:
+        time.sleep(0.01)
+    stream.stop()
+    server.stop()
+    thread.join(timeout=5)
+
+    count = min(len(received_times), len(server.sent_times))
+    if count == 0:
+        return {"messages": 0}
+    sent = np.asarray(server.sent_times[:count])
+    received = np.asarray(received_times[:count])
+    latency_ms = (received - sent) * 1000
+    elapsed = received[-1] - sent[0]
+    return {
+        "messages": count,
+        "expected": expected,
+        "elapsed_s": round(float(elapsed), 4),
+        "messages_per_second": (
+            round(float(count / elapsed), 1) if elapsed > 0 else None
+        ),
+        "latency_p50_ms": round(float(np.percentile(latency_ms, 50)), 3),
+        "latency_p99_ms": round(float(np.percentile(latency_ms, 99)), 3),
+        "latency_max_ms": round(float(latency_ms.max()), 3),
+    }
+
+
+def _parse_speed(value):
+    return None if value == "max" else float(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded ticker feed")
+    parser.add_argument("recording", help="JSONL frames or ticker_data.csv file")
+    parser.add_argument(
+        "--speed", type=_parse_speed, default=1.0, help="1 = real time, N, or 'max'"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure EnhancedCryptoStream ingest instead of serving",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(measure_ingest(args.recording, speed=args.speed))
+    else:
+        replay = ReplayServer(
+            load_recording(args.recording),
+            host=args.host,
+            port=args.port,
+            speed=args.speed,
+        )
+        print(f"Replaying {args.recording} on {replay.start()}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            replay.stop()
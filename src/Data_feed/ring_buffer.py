@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity, array-backed ring buffer for numeric history.
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the most
+    recent ``n`` values always form one contiguous slice of the backing array
+    and can be returned as a zero-copy view instead of a Python list.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self._head = 0  # Next write position in [0, capacity)
+        self._size = 0
+        self.total = 0  # Number of values ever appended
+
+    @property
+    def maxlen(self):
+        """Capacity, mirroring the deque attribute this type replaces"""
+        return self.capacity
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.last())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.last()
+        if dtype is not None and np.dtype(dtype) != self.dtype:
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __getitem__(self, key):
+        """Index like a sequence; integer keys return Python scalars"""
+        if isinstance(key, slice):
+            return self.last()[key]
+        size = self._size
+        index = int(key)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ring buffer index out of range")
+        return self._data[self._head + self.capacity - size + index].item()
+
+    def __repr__(self):
+        return f"RingBuffer({self.last()!r}, capacity={self.capacity})"
+
+    def append(self, value):
+        """Append one value, overwriting the oldest one when full"""
+        head = self._head
+        self._data[head] = value
+        self._data[head + self.capacity] = value
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        if self._size < self.capacity:
+            self._size += 1
+        self.total += 1
+
+    def extend(self, values):
+        """Append many values with vectorized writes"""
+        values = np.asarray(values, dtype=self.dtype)
+        count = len(values)
+        if count == 0:
+            return
+        values = values[-self.capacity :]
+        n = len(values)
+        positions = (self._head + np.arange(n)) % self.capacity
+        self._data[positions] = values
+        self._data[positions + self.capacity] = values
+        self._head = (self._head + n) % self.capacity
+        self._size = min(self.capacity, self._size + n)
+        self.total += count
+
+    def last(self, n=None):
+        """Return the most recent ``n`` values, oldest first, as a read-only view.
+
+        The view shares memory with the buffer: a slot is overwritten once it
+        ages out, i.e. after ``capacity - n`` further appends. Copy it if it
+        must outlive that.
+        """
+        size = self._size
+        n = size if n is None else max(0, min(int(n), size))
+        end = self._head + self.capacity
+        view = self._data[end - n : end]
+        view.flags.writeable = False
+        return view
+
+    def trim(self, n):
+        """Keep only the most recent ``n`` values without reallocating"""
+        self._size = max(0, min(int(n), self._size))
+
+    def clear(self):
+        """Drop all values"""
+        self._size = 0
@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import numpy as np
+
+
+def _utc_offset_ms(time_ms):
+    """Local UTC offset in ms at an epoch-ms instant"""
+    offset = datetime.fromtimestamp(time_ms / 1000).astimezone().utcoffset()
+    return int(offset.total_seconds() * 1000)
+
+
+def to_local_datetime64(times_ms):
+    """
+    Convert epoch-ms timestamps to local wall-clock datetime64[ms] in bulk.
+
+    Matches datetime.fromtimestamp(t / 1000) element by element. A single
+    UTC offset is applied with one vectorized add unless the window spans
+    a DST change, in which case each element is converted individually.
+    """
+    times_ms = np.asarray(times_ms, dtype=np.int64)
+    if len(times_ms) == 0:
+        return np.empty(0, dtype="datetime64[ms]")
+    offset = _utc_offset_ms(int(times_ms[0]))
+    if offset == _utc_offset_ms(int(times_ms[-1])):
+        return (times_ms + offset).astype("datetime64[ms]")
+    return np.array(
+        [datetime.fromtimestamp(t / 1000) for t in times_ms.tolist()],
+        dtype="datetime64[ms]",
+    )
+
+
+class PriceSnapshot:
+    """Immutable point-in-time copy of one product's price history.
+
+    Prices, times and every series derived from them through this object
+    come from the same stream version, so chart traces always line up.
+    """
+
+    __slots__ = ("version", "times", "prices", "total", "_derived")
+
+    def __init__(self, version, times, prices, total=None):
+        times.flags.writeable = False
+        prices.flags.writeable = False
+        self.version = version
+        self.times = times
+        self.prices = prices
+        # Points ever appended; prices[i] has sequence number
+        # total - len(prices) + i + 1, so clients can ask for what is new
+        self.total = len(prices) if total is None else total
+        self._derived = {}
+
+    def __len__(self):
+        return len(self.prices)
+
+    @property
+    def last_price(self):
+        """Most recent price, or None when empty"""
+        return self.prices[-1].item() if len(self.prices) else None
+
+    @property
+    def last_time(self):
+        """Most recent epoch-ms timestamp, or None when empty"""
+        return self.times[-1].item() if len(self.times) else None
+
+    @property
+    def first_seq(self):
+        """Sequence number of prices[0]"""
+        return self.total - len(self.prices) + 1
+
+    def since(self, seq):
+        """Index of the first point newer than sequence number `seq`"""
+        if seq is None:
+            return 0
+        return min(len(self.prices), max(0, seq - self.first_seq + 1))
+
+    def local_times(self):
+        """Times as local datetime64[ms], converted once per snapshot"""
+        values = self._derived.get("local_times")
+        if values is None:
+            values = to_local_datetime64(self.times)
+            values.flags.writeable = False
+            self._derived["local_times"] = values
+        return values
+
+    def rolling_mean(self, window):
+        """
+        Simple moving average over the snapshot, cached per window.
+
+        Returns:
+            Array aligned with ``times[window - 1:]``; empty if too short
+        """
+        key = ("sma", window)
+        values = self._derived.get(key)
+        if values is None:
+            if len(self.prices) < window:
+                values = np.empty(0, dtype=np.float64)
+            else:
+                sums = np.cumsum(self.prices, dtype=np.float64)
+                sums[window:] = sums[window:] - sums[:-window]
+                values = sums[window - 1 :] / window
+            values.flags.writeable = False
+            self._derived[key] = values
+        return values
@@ -0,0 +1,250 @@
+import csv
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.Data_feed.message_decoder import get_json_backend
+
+# Per-tick columns shared by the tick store and bulk parsers
+TICK_DTYPE = np.dtype(
+    [
+        ("time", np.int64),  # Exchange time, epoch ms
+        ("price", np.float64),
+        ("last_size", np.float64),
+        ("best_bid", np.float64),
+        ("best_bid_size", np.float64),
+        ("best_ask", np.float64),
+        ("best_ask_size", np.float64),
+        ("open_24h", np.float64),
+        ("volume_24h", np.float64),
+        ("low_24h", np.float64),
+        ("high_24h", np.float64),
+        ("volume_30d", np.float64),
+        ("side", np.int8),  # 1 = buy, -1 = sell, 0 = unknown
+        ("trade_id", np.int64),
+    ]
+)
+
+# Multi-product batches additionally carry the product and feed sequence
+TICKER_DTYPE = np.dtype(
+    [("product_id", "S16"), ("sequence", np.int64)] + TICK_DTYPE.descr
+)
+
+FLOAT_FIELDS = (
+    "price",
+    "open_24h",
+    "volume_24h",
+    "low_24h",
+    "high_24h",
+    "volume_30d",
+    "best_bid",
+    "best_bid_size",
+    "best_ask",
+    "best_ask_size",
+    "last_size",
+)
+
+SIDES = {"buy": 1, "sell": -1}
+SIDE_NAMES = {1: "buy", -1: "sell"}
+
+# Column order of ticker_data.csv (see CryptoDataModel.CSV_HEADER)
+CSV_FIELDS = (
+    "time",
+    "product_id",
+    "price",
+    "open_24h",
+    "volume_24h",
+    "low_24h",
+    "high_24h",
+    "volume_30d",
+    "best_bid",
+    "best_bid_size",
+    "best_ask",
+    "best_ask_size",
+    "side",
+    "trade_id",
+    "last_size",
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _float(value):
+    return float(value) if value not in (None, "") else np.nan
+
+
+def _int(value):
+    return int(value) if value not in (None, "") else 0
+
+
+def parse_time_us(value):
+    """Parse a feed ISO-8601 timestamp into integer epoch microseconds"""
+    if not value:
+        return 0
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    delta = moment - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def format_time_us(time_us):
+    """Format epoch microseconds the way the feed does"""
+    moment = datetime.fromtimestamp(time_us // 1_000_000, timezone.utc).replace(
+        microsecond=time_us % 1_000_000
+    )
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class TickerRecord:
+    """Compact ticker record.
+
+    Slots instead of a per-instance dict, numeric fields as floats, time as
+    epoch microseconds and interned product/side strings. TickerData and
+    CryptoDataModel.Ticker are thin adapters over this class.
+    """
+
+    __slots__ = ("product_id", "sequence", "time_us", "side", "trade_id") + FLOAT_FIELDS
+
+    def _fill(self, data):
+        """Populate all fields from a ticker message dict"""
+        product_id = data.get("product_id")
+        self.product_id = sys.intern(product_id) if product_id else product_id
+        self.sequence = data.get("sequence")
+        self.time_us = parse_time_us(data.get("time"))
+        side = data.get("side")
+        self.side = SIDE_NAMES.get(SIDES.get(side), side)
+        self.trade_id = data.get("trade_id")
+        for name in FLOAT_FIELDS:
+            setattr(self, name, _float(data.get(name)))
+
+    @classmethod
+    def from_message(cls, data):
+        """Create a record from a ticker message dict"""
+        record = cls.__new__(cls)
+        TickerRecord._fill(record, data)
+        return record
+
+    @property
+    def time(self):
+        """Exchange time as the feed's ISO-8601 string"""
+        return format_time_us(self.time_us) if self.time_us else None
+
+    @time.setter
+    def time(self, value):
+        self.time_us = parse_time_us(value)
+
+    @property
+    def time_ms(self):
+        """Exchange time, epoch ms"""
+        return self.time_us // 1000
+
+    def to_tick(self):
+        """Row tuple in TICK_DTYPE order"""
+        return (
+            self.time_ms,
+            self.price,
+            self.last_size,
+            self.best_bid,
+            self.best_bid_size,
+            self.best_ask,
+            self.best_ask_size,
+            self.open_24h,
+            self.volume_24h,
+            self.low_24h,
+            self.high_24h,
+            self.volume_30d,
+            SIDES.get(self.side, 0),
+            _int(self.trade_id),
+        )
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(product_id={self.product_id!r}, "
+            f"price={self.price}, time={self.time!r})"
+        )
+
+
+def ticker_row(data):
+    """Convert a ticker message dict into a TICK_DTYPE row tuple"""
+    return (
+        parse_time_us(data.get("time")) // 1000,
+        _float(data.get("price")),
+        _float(data.get("last_size")),
+        _float(data.get("best_bid")),
+        _float(data.get("best_bid_size")),
+        _float(data.get("best_ask")),
+        _float(data.get("best_ask_size")),
+        _float(data.get("open_24h")),
+        _float(data.get("volume_24h")),
+        _float(data.get("low_24h")),
+        _float(data.get("high_24h")),
+        _float(data.get("volume_30d")),
+        SIDES.get(data.get("side"), 0),
+        _int(data.get("trade_id")),
+    )
+
+
+def _ticker_array_row(data):
+    """Convert a ticker message dict into a TICKER_DTYPE row tuple"""
+    return (
+        (data.get("product_id") or "").encode(),
+        _int(data.get("sequence")),
+    ) + ticker_row(data)
+
+
+def parse_messages(messages, backend=None):
+    """
+    Bulk-convert ticker messages into a TICKER_DTYPE structured array.
+
+    Args:
+        messages: Raw frames (str/bytes) and/or already-decoded dicts;
+            non-ticker messages are skipped
+        backend: JSON backend name, defaults to the fastest installed
+
+    Returns:
+        Structured array with one row per ticker
+    """
+    _, loads = get_json_backend(backend)
+    rows = []
+    for message in messages:
+        data = message if isinstance(message, dict) else loads(message)
+        if data.get("type", "ticker") == "ticker":
+            rows.append(_ticker_array_row(data))
+    return np.array(rows, dtype=TICKER_DTYPE)
+
+
+def parse_csv_rows(rows):
+    """
+    Bulk-convert ticker_data.csv rows into a TICKER_DTYPE structured array.
+
+    Args:
+        rows: Lists in CSV_HEADER column order (csv.reader output, without
+            the header) or dicts keyed by message field name
+    """
+    return np.array(
+        [
+            _ticker_array_row(row if isinstance(row, dict) else dict(zip(CSV_FIELDS, row)))
+            for row in rows
+        ],
+        dtype=TICKER_DTYPE,
+    )
+
+
+def read_ticker_csv(path):
+    """Load a ticker_data.csv file into a TICKER_DTYPE structured array"""
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)  # Header
+        return parse_csv_rows(reader)
+
+
+def split_by_product(records):
+    """Split a TICKER_DTYPE array into {product_id: TICK_DTYPE array}"""
+    result = {}
+    for product_id in np.unique(records["product_id"]):
+        selected = records[records["product_id"] == product_id]
+        ticks = np.empty(len(selected), dtype=TICK_DTYPE)
+        for name in TICK_DTYPE.names:
+            ticks[name] = selected[name]
+        result[product_id.decode()] = ticks
+    return result
@@ -0,0 +1,214 @@
+import argparse
+import os
+
+import numpy as np
+
+from src.Data_feed.tick_record import (
+    TICK_DTYPE,
+    read_ticker_csv,
+    split_by_product,
+    ticker_row,
+)
+
+MS_PER_DAY = 86_400_000
+
+
+class TickStore:
+    """Append-only, memory-mapped columnar tick store.
+
+    Layout: ``<root>/<product_id>/<YYYY-MM-DD>/<column>.bin``, each file a
+    raw little-endian array of one TICK_DTYPE field. Appends are buffered
+    per product and written in batches; reads memory-map the column files
+    and slice them by time without any parsing.
+    """
+
+    def __init__(self, root="tick_store", batch_size=1024):
+        self.root = root
+        self.batch_size = batch_size
+        self._pending = {}  # product_id -> list of row tuples
+        self._unsynced = set()  # Files and new directories written since sync()
+        self._repaired = set()  # Segments checked for torn writes this process
+
+    def append(self, product_id, data):
+        """Buffer one ticker message dict; flushes when the batch is full"""
+        rows = self._pending.setdefault(product_id, [])
+        rows.append(ticker_row(data))
+        if len(rows) >= self.batch_size:
+            self.flush(product_id)
+
+    def append_array(self, product_id, records):
+        """Write a TICK_DTYPE structured array straight to the segments"""
+        self._write(product_id, np.asarray(records, dtype=TICK_DTYPE))
+
+    def flush(self, product_id=None, fsync=False):
+        """
+        Write buffered rows of one or all products.
+
+        Written data sits in the OS page cache; pass fsync=True (or call
+        sync()) to make it durable.
+        """
+        product_ids = [product_id] if product_id else list(self._pending)
+        for pid in product_ids:
+            rows = self._pending.pop(pid, None)
+            if rows:
+                self._write(pid, np.array(rows, dtype=TICK_DTYPE))
+        if fsync:
+            self.sync()
+
+    def sync(self):
+        """fsync every segment file and new directory written since last sync"""
+        while self._unsynced:
+            path = self._unsynced.pop()
+            is_dir = os.path.isdir(path)
+            if is_dir and not hasattr(os, "O_DIRECTORY"):
+                continue  # Directories cannot be opened for fsync here
+            fd = os.open(path, os.O_RDONLY | (os.O_DIRECTORY if is_dir else 0))
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _write(self, product_id, records):
+        if len(records) == 0:
+            return
+        days = records["time"] // MS_PER_DAY
+        # Split at day boundaries so each segment holds a single UTC day
+        boundaries = np.flatnonzero(np.diff(days)) + 1
+        for chunk in np.split(records, boundaries):
+            segment = self._segment_dir(product_id, int(chunk["time"][0]))
+            if not os.path.isdir(segment):
+                os.makedirs(segment, exist_ok=True)
+                # New directory entries must be synced for the files to be
+                # found after a crash
+                self._unsynced.update((segment, os.path.dirname(segment), self.root))
+            if segment not in self._repaired:
+                self._repair(segment)
+            for name in TICK_DTYPE.names:
+                path = os.path.join(segment, f"{name}.bin")
+                with open(path, "ab") as file:
+                    np.ascontiguousarray(chunk[name]).tofile(file)
+                self._unsynced.add(path)
+
+    def _repair(self, segment):
+        """
+        Cut a segment's column files back to their common whole rows.
+
+        A crash between column appends leaves some files longer than others
+        (or ending in a partial element); appending after that would shift
+        every later row out of line, so the extra bytes are dropped first.
+        """
+        self._repaired.add(segment)
+        paths = {
+            name: os.path.join(segment, f"{name}.bin") for name in TICK_DTYPE.names
+        }
+        sizes = {
+            name: os.path.getsize(path) if os.path.exists(path) else 0
+            for name, path in paths.items()
+        }
+        length = min(
+            sizes[name] // TICK_DTYPE.fields[name][0].itemsize for name in paths
+        )
+        for name, path in paths.items():
+            size = length * TICK_DTYPE.fields[name][0].itemsize
+            if sizes[name] > size:
+                os.truncate(path, size)
+                self._unsynced.add(path)
+
+    def _segment_dir(self, product_id, time_ms):
+        day = np.datetime64(time_ms // MS_PER_DAY, "D")
+        return os.path.join(self.root, product_id, str(day))
+
+    def products(self):
+        """Product ids present in the store"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def days(self, product_id):
+        """Segment days (YYYY-MM-DD) stored for a product, oldest first"""
+        path = os.path.join(self.root, product_id)
+        return sorted(os.listdir(path)) if os.path.isdir(path) else []
+
+    def _map_column(self, segment, name):
+        path = os.path.join(segment, f"{name}.bin")
+        dtype = TICK_DTYPE.fields[name][0]
+        # Map whole elements only: a torn write may leave a partial one
+        count = os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+    def read(self, product_id, start_ms=None, end_ms=None, columns=None):
+        """
+        Read ticks in [start_ms, end_ms) as NumPy arrays.
+
+        Ticks within a segment are assumed to be in time order, as the feed
+        delivers them. A range inside a single day is returned as zero-copy
+        memory-mapped slices.
+
+        Returns:
+            Dict of column name -> array, always including "time"
+        """
+        columns = list(columns or TICK_DTYPE.names)
+        if "time" not in columns:
+            columns.insert(0, "time")
+
+        parts = {name: [] for name in columns}
+        start_day = None if start_ms is None else start_ms // MS_PER_DAY
+        end_day = None if end_ms is None else (end_ms - 1) // MS_PER_DAY
+        for day in self.days(product_id):
+            day_number = int(np.datetime64(day, "D").astype(np.int64))
+            if start_day is not None and day_number < start_day:
+                continue
+            if end_day is not None and day_number > end_day:
+                continue
+
+            segment = os.path.join(self.root, product_id, day)
+            mapped = {name: self._map_column(segment, name) for name in columns}
+            # Guard against a torn final write: whole elements only, and the
+            # shortest column
+            length = min(len(values) for values in mapped.values())
+            times = mapped["time"][:length]
+            lo = 0 if start_ms is None else np.searchsorted(times, start_ms, "left")
+            hi = length if end_ms is None else np.searchsorted(times, end_ms, "left")
+            for name in columns:
+                parts[name].append(mapped[name][lo:hi])
+
+        result = {}
+        for name in columns:
+            chunks = parts[name]
+            if not chunks:
+                result[name] = np.empty(0, dtype=TICK_DTYPE.fields[name][0])
+            elif len(chunks) == 1:
+                result[name] = chunks[0]
+            else:
+                result[name] = np.concatenate(chunks)
+        return result
+
+
+def convert_csv(csv_path, store):
+    """
+    Load a ticker_data.csv file into a TickStore.
+
+    Returns:
+        Number of rows converted
+    """
+    records = read_ticker_csv(csv_path)
+    for product_id, ticks in split_by_product(records).items():
+        store.append_array(product_id, ticks)
+    return len(records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert ticker CSV to a tick store")
+    parser.add_argument("csv_path", help="File in the ticker_data.csv schema")
+    parser.add_argument("--root", default="tick_store", help="Tick store directory")
+    args = parser.parse_args()
+
+    tick_store = TickStore(args.root)
+    converted = convert_csv(args.csv_path, tick_store)
+    print(f"Converted {converted} rows into {args.root}")
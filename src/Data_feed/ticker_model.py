@@ -1,42 +1,33 @@
-class TickerData:
-    """Data model for managing ticker data."""
+from src.Data_feed.tick_record import FLOAT_FIELDS, SIDE_NAMES, SIDES, TickerRecord
+
+
+class TickerData(TickerRecord):
+    """Data model for managing ticker data.
+
+    Adapter over the compact TickerRecord; fields live in slots.
+    """
+
+    __slots__ = ()
 
     def __init__(self, data):
         """Initialize the TickerData object with the provided data."""
-        self.type = data.get("type")
-        self.sequence = data.get("sequence")
-        self.product_id = data.get("product_id")
-        self.price = float(data.get("price"))
-        self.open_24h = float(data.get("open_24h"))
-        self.volume_24h = float(data.get("volume_24h"))
-        self.low_24h = float(data.get("low_24h"))
-        self.high_24h = float(data.get("high_24h"))
-        self.volume_30d = float(data.get("volume_30d"))
-        self.best_bid = float(data.get("best_bid"))
-        self.best_bid_size = float(data.get("best_bid_size"))
-        self.best_ask = float(data.get("best_ask"))
-        self.best_ask_size = float(data.get("best_ask_size"))
-        self.side = data.get("side")
-        self.time = data.get("time")
-        self.trade_id = data.get("trade_id")
-        self.last_size = float(data.get("last_size"))
+        self._fill(data)
+
+    @property
+    def type(self):
+        return "ticker"
 
     def update(self, data):
         """Update the ticker data with new values."""
-        self.price = float(data.get("price", self.price))
-        self.open_24h = float(data.get("open_24h", self.open_24h))
-        self.volume_24h = float(data.get("volume_24h", self.volume_24h))
-        self.low_24h = float(data.get("low_24h", self.low_24h))
-        self.high_24h = float(data.get("high_24h", self.high_24h))
-        self.volume_30d = float(data.get("volume_30d", self.volume_30d))
-        self.best_bid = float(data.get("best_bid", self.best_bid))
-        self.best_bid_size = float(data.get("best_bid_size", self.best_bid_size))
-        self.best_ask = float(data.get("best_ask", self.best_ask))
-        self.best_ask_size = float(data.get("best_ask_size", self.best_ask_size))
-        self.side = data.get("side", self.side)
-        self.time = data.get("time", self.time)
-        self.trade_id = data.get("trade_id", self.trade_id)
-        self.last_size = float(data.get("last_size", self.last_size))
+        for name in FLOAT_FIELDS:
+            if name in data:
+                setattr(self, name, float(data[name]))
+        if "side" in data:
+            self.side = SIDE_NAMES.get(SIDES.get(data["side"]), data["side"])
+        if "time" in data:
+            self.time = data["time"]
+        if "trade_id" in data:
+            self.trade_id = data["trade_id"]
 
     def display(self):
         """Display the ticker data."""
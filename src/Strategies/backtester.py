@@ -0,0 +1,336 @@
+import argparse
+import os
+
+import numpy as np
+
+from src.Strategies.moving_average import MovingAverageStrategy, window_mean
+from src.Strategies.performance import TradeStats
+from src.utils.fees_calculator import FeeSchedule
+
+# Rolling sums are built from cumulative sums over chunks of this many
+# outputs, re-centred on the chunk's first price, so rounding error stays
+# far below MovingAverageStrategy.exact_tolerance however long the series.
+ROLLING_CHUNK = 8192
+
+
+def rolling_mean(prices, window, chunk=ROLLING_CHUNK):
+    """
+    Trailing simple moving average of a price array.
+
+    Returns:
+        Array aligned with prices; NaN until the window has filled
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+    out = np.full(n, np.nan)
+    for start in range(window - 1, n, chunk):
+        stop = min(n, start + chunk)
+        segment = prices[start - window + 1 : stop]
+        base = segment[0]
+        sums = np.empty(len(segment) + 1)
+        sums[0] = 0.0
+        np.cumsum(segment - base, out=sums[1:])
+        out[start:stop] = (sums[window:] - sums[:-window]) / window + base
+    return out
+
+
+def crossover_signals(prices, short_window, long_window, short_ma=None, long_ma=None):
+    """
+    Vectorized MovingAverageStrategy.calculate_signals for every tick.
+
+    Element i equals the signal calculate_signals(prices[: i + 1]) returns:
+    1 = buy, -1 = sell, 0 = None.
+
+    Args:
+        short_ma, long_ma: Precomputed rolling_mean arrays to reuse
+
+    Returns:
+        (signals, short_ma, long_ma)
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if short_ma is None:
+        short_ma = rolling_mean(prices, short_window)
+    if long_ma is None:
+        long_ma = rolling_mean(prices, long_window)
+
+    with np.errstate(invalid="ignore"):
+        signals = np.sign(short_ma - long_ma)
+        scale = np.maximum(np.abs(short_ma), np.abs(long_ma))
+        close = np.abs(short_ma - long_ma) <= (
+            MovingAverageStrategy.exact_tolerance * scale
+        )
+    signals = np.nan_to_num(signals).astype(np.int8)
+
+    # Settle near-ties exactly, the way calculate_signals does
+    for i in np.flatnonzero(close):
+        history = prices[: i + 1]
+        short_value = window_mean(history, short_window)
+        long_value = window_mean(history, long_window)
+        signals[i] = (short_value > long_value) - (short_value < long_value)
+    return signals, short_ma, long_ma
+
+
+def trade_indices(signals):
+    """
+    Ticks where execute_trade actually trades.
+
+    Starting flat, a buy executes on the first buy signal and a sell on the
+    first sell signal after it, so trades happen exactly where the sequence
+    of non-None signals changes value (with an implicit leading sell).
+    """
+    nonzero = np.flatnonzero(signals)
+    values = signals[nonzero]
+    previous = np.concatenate(([-1], values[:-1]))
+    return nonzero[values != previous]
+
+
+class BacktestResult:
+    """Trades and metrics of one vectorized backtest run"""
+
+    def __init__(
+        self,
+        prices,
+        times,
+        signals,
+        short_ma,
+        long_ma,
+        investment_amount,
+        trading_fee,
+        fee_schedule=None,
+        volume_30d=0,
+    ):
+        """
+        Args:
+            trading_fee: Flat fee rate, used when fee_schedule is None
+            fee_schedule: FeeSchedule for fees and taxes
+            volume_30d: 30-day volume selecting the fee tier; a scalar or an
+                array aligned with prices
+        """
+        self.signals = signals
+        self.short_ma = short_ma
+        self.long_ma = long_ma
+        self.investment_amount = investment_amount
+        self.trading_fee = trading_fee
+        self.fee_schedule = fee_schedule or FeeSchedule.flat(trading_fee)
+
+        index = trade_indices(signals)
+        self.trade_index = index
+        self.trade_price = prices[index]
+        self.trade_time = times[index]
+        self.trade_type = np.where(np.arange(len(index)) % 2 == 0, "buy", "sell")
+
+        # Same FeeSchedule formulas as execute_trade, element by element
+        if np.ndim(volume_30d):
+            volume_30d = np.asarray(volume_30d)[index]
+        buy_volume = volume_30d if np.ndim(volume_30d) == 0 else volume_30d[0::2]
+        sell_volume = volume_30d if np.ndim(volume_30d) == 0 else volume_30d[1::2]
+        settled = self.fee_schedule.settle(
+            investment_amount,
+            self.trade_price[0::2],
+            self.trade_price[1::2],
+            buy_volume,
+            sell_volume_30d=sell_volume,
+        )
+        self.gross_proceeds = settled["gross_proceeds"]
+        self.taxes = settled["tax"]
+        self.net_proceeds = settled["net_proceeds"]
+        self.profit_loss = settled["profit_loss"]
+
+        self.coins = np.empty(len(index))
+        self.coins[0::2] = settled["coins"]
+        self.coins[1::2] = settled["coins"][: len(self.net_proceeds)]
+        self.fees = np.empty(len(index))
+        self.fees[0::2] = settled["buy_fee"]
+        self.fees[1::2] = settled["sell_fee"]
+
+        # execute_trade accumulates fees one trade at a time; cumsum adds in
+        # the same order, unlike the pairwise np.sum
+        self.total_fees_paid = float(np.cumsum(self.fees)[-1]) if len(index) else 0
+        self.total_taxes_paid = (
+            float(np.cumsum(self.taxes)[-1]) if len(self.taxes) else 0
+        )
+        has_signal = bool(np.any(signals))
+        self.initial_balance = investment_amount if has_signal else 0
+        self.current_balance = (
+            float(self.net_proceeds[-1])
+            if len(self.net_proceeds)
+            else self.initial_balance
+        )
+        self.position = "long" if len(index) % 2 == 1 else None
+
+    def trades(self):
+        """Trade list in the same dict format as MovingAverageStrategy.trades"""
+        trades = []
+        for i in range(len(self.trade_index)):
+            trade = {
+                "type": str(self.trade_type[i]),
+                "price": self.trade_price[i].item(),
+                "coins": self.coins[i].item(),
+                "timestamp": self.trade_time[i].item(),
+                "fee": self.fees[i].item(),
+            }
+            if i % 2 == 0:
+                trade["investment"] = self.investment_amount
+            else:
+                sell = i // 2
+                trade["gross_proceeds"] = self.gross_proceeds[sell].item()
+                trade["net_proceeds"] = self.net_proceeds[sell].item()
+                trade["profit_loss"] = self.profit_loss[sell].item()
+                trade["tax"] = self.taxes[sell].item()
+            trades.append(trade)
+        return trades
+
+    def metrics(self):
+        """Same keys and rounding as MovingAverageStrategy.get_performance_metrics
+
+        The live balance reset below reset_threshold is a dashboard display
+        rule and is not applied to backtests.
+        """
+        total_trades = len(self.trade_index)
+        if total_trades == 0:
+            return {
+                "total_trades": 0,
+                "current_balance": self.initial_balance,
+                "total_profit_loss": 0,
+                "total_fees": 0,
+                "total_taxes": 0,
+                "return_percentage": 0,
+                "position": "No position",
+            }
+
+        total_profit_loss = self.current_balance - self.initial_balance
+        stats = self.stats()
+        metrics = {
+            "total_trades": total_trades,
+            "current_balance": round(self.current_balance, 2),
+            "total_profit_loss": round(total_profit_loss, 2),
+            "total_fees": round(self.total_fees_paid, 2),
+            "total_taxes": round(self.total_taxes_paid, 2),
+            "return_percentage": round(
+                (total_profit_loss / self.initial_balance) * 100, 2
+            ),
+            "position": self.position if self.position else "No position",
+            "win_rate": round(stats.win_rate, 2),
+        }
+        metrics.update(stats.to_dict())
+        return metrics
+
+    def stats(self):
+        """TradeStats folded over the closed trades, in execution order"""
+        stats = TradeStats(self.initial_balance)
+        for profit_loss in self.profit_loss.tolist():
+            stats.record_close(profit_loss, self.investment_amount)
+        return stats
+
+
+def backtest(
+    prices,
+    times=None,
+    short_window=10,
+    long_window=50,
+    investment_amount=1000,
+    trading_fee=0.0001,
+    short_ma=None,
+    long_ma=None,
+    fee_schedule=None,
+    volume_30d=0,
+):
+    """
+    Vectorized backtest of the moving-average crossover strategy.
+
+    Produces the same trades, fees and P&L as calling calculate_signals and
+    execute_trade on every tick (ticks with a non-positive price never
+    trade, as on the dashboard).
+
+    Args:
+        prices: Price array
+        times: Timestamps aligned with prices (defaults to the tick index)
+        short_ma, long_ma: Precomputed rolling_mean arrays to reuse
+        fee_schedule: FeeSchedule (defaults to a flat trading_fee)
+        volume_30d: Fee-tier volume, scalar or aligned with prices
+
+    Returns:
+        BacktestResult
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    times = np.arange(len(prices)) if times is None else np.asarray(times)
+    signals, short_ma, long_ma = crossover_signals(
+        prices, short_window, long_window, short_ma, long_ma
+    )
+    signals[prices <= 0] = 0
+    return BacktestResult(
+        prices,
+        times,
+        signals,
+        short_ma,
+        long_ma,
+        investment_amount,
+        trading_fee,
+        fee_schedule,
+        volume_30d,
+    )
+
+
+def load_price_series(source, product_id="BTC-USD", start_ms=None, end_ms=None):
+    """
+    Load (prices, times, volume_30d) from a ticker CSV file or a tick store
+    directory.
+
+    Returns:
+        Float64 prices, epoch-ms int64 times and the 30-day volume at each
+        tick (for fee tiers; missing values are 0, the lowest tier)
+    """
+    from src.Data_feed.tick_record import read_ticker_csv
+    from src.Data_feed.tick_store import TickStore
+
+    if isinstance(source, TickStore) or os.path.isdir(source):
+        store = source if isinstance(source, TickStore) else TickStore(source)
+        columns = store.read(
+            product_id, start_ms, end_ms, columns=["price", "volume_30d"]
+        )
+        return (
+            np.asarray(columns["price"]),
+            np.asarray(columns["time"]),
+            np.nan_to_num(np.asarray(columns["volume_30d"])),
+        )
+
+    records = read_ticker_csv(source)
+    records = records[records["product_id"] == product_id.encode()]
+    times = records["time"]
+    selected = np.ones(len(records), dtype=bool)
+    if start_ms is not None:
+        selected &= times >= start_ms
+    if end_ms is not None:
+        selected &= times < end_ms
+    return (
+        records["price"][selected],
+        times[selected],
+        np.nan_to_num(records["volume_30d"][selected]),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest MovingAverageStrategy")
+    parser.add_argument("source", help="ticker CSV file or tick store directory")
+    parser.add_argument("--product", default="BTC-USD")
+    parser.add_argument("--short", type=int, default=10)
+    parser.add_argument("--long", type=int, default=50)
+    parser.add_argument("--investment", type=float, default=1000)
+    parser.add_argument("--fee", type=float, default=0.0001)
+    parser.add_argument("--tax", type=float, default=0.0, help="tax on profits")
+    args = parser.parse_args()
+
+    series_prices, series_times, series_volume = load_price_series(
+        args.source, args.product
+    )
+    result = backtest(
+        series_prices,
+        series_times,
+        args.short,
+        args.long,
+        args.investment,
+        args.fee,
+        fee_schedule=FeeSchedule.flat(args.fee, args.tax),
+        volume_30d=series_volume,
+    )
+    print(result.metrics())
@@ -0,0 +1,121 @@
+import threading
+import time
+
+from src.Strategies.strategy_runner import StrategyRunner, trade_handler
+
+
+class StrategyEngine:
+    """Evaluates strategies as the stream produces prices.
+
+    The engine registers itself as a bar listener, so every close of the
+    stream's aggregation interval (or of a chosen bar interval) runs the
+    strategies right away, on the stream's thread. Trades therefore no
+    longer wait for a dashboard refresh and do not depend on how many
+    viewers are connected. After each delivery the engine publishes a
+    read-only result per strategy; readers only ever see a complete
+    result.
+    """
+
+    def __init__(self, stream, interval=None, history_rows=5):
+        """
+        Args:
+            stream: EnhancedCryptoStream (or subclass) to listen to
+            interval: Bar interval that drives evaluation (defaults to the
+                stream's aggregate_interval, i.e. every aggregated price)
+            history_rows: Trade history rows included in each result
+        """
+        self.stream = stream
+        self.interval = interval or stream.aggregate_interval
+        self.history_rows = history_rows
+        self.runner = StrategyRunner(batch_size=1, flush_interval=0)
+        self._results = {}
+        self._lock = threading.Lock()
+
+        # Event-to-decision latency
+        self.events = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+        stream.add_bar_listener(self.on_bar)
+
+    def add_strategy(self, strategy, name=None, symbols=None, investment_amount=1000):
+        """
+        Register a MovingAverageStrategy-style strategy (update/execute_trade).
+
+        Without symbols the strategy gets only its own symbol's prices (see
+        StrategyRunner.register).
+
+        Returns:
+            The strategy name used by result()
+        """
+        name = name or f"{type(strategy).__name__}-{len(self.runner.slots) + 1}"
+        self._results[name] = self._publish(strategy, None, None, None)
+        self.runner.register(
+            strategy,
+            name=name,
+            symbols=symbols,
+            handler=self._handler(name, strategy, investment_amount),
+        )
+        return name
+
+    def _handler(self, name, strategy, investment_amount):
+        trade = trade_handler(strategy, investment_amount)
+
+        def handle(product_ids, prices, times, sequences):
+            # Fee tiers follow the feed's latest 30-day volume
+            if hasattr(strategy, "volume_30d"):
+                strategy.volume_30d = self.stream.get_volume_30d(str(product_ids[-1]))
+            signal = trade(product_ids, prices, times, sequences)
+            self._results[name] = self._publish(
+                strategy, signal, prices[-1].item(), times[-1].item()
+            )
+
+        return handle
+
+    def _publish(self, strategy, signal, price, timestamp):
+        # get_performance_metrics may apply the balance reset, so it is only
+        # ever called here, on the engine's thread
+        return {
+            "signal": signal,
+            "price": price,
+            "timestamp": timestamp,
+            "short_ma": getattr(strategy, "short_ma", None),
+            "long_ma": getattr(strategy, "long_ma", None),
+            "metrics": strategy.get_performance_metrics(),
+            "trade_history": strategy.get_trade_history(limit=self.history_rows),
+            # Changes exactly when trade_history does, even across resets
+            "trade_seq": getattr(getattr(strategy, "trades", None), "total", None),
+        }
+
+    def on_bar(self, product_id, interval, bar):
+        """Stream bar listener: evaluate strategies on the bar's close"""
+        if interval != self.interval:
+            return
+        start = time.perf_counter()
+        self.runner.submit(product_id, bar.close, bar.start)
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.events += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self.total_latency += latency
+
+    def result(self, name=None):
+        """Latest published result of a strategy (the first one by default)"""
+        if name is None:
+            name = next(iter(self._results), None)
+        return self._results.get(name)
+
+    def stats(self):
+        """Event-to-decision latency (ms) and per-strategy runner counters"""
+        with self._lock:
+            return {
+                "events": self.events,
+                "last_latency_ms": round(self.last_latency * 1000, 4),
+                "max_latency_ms": round(self.max_latency * 1000, 4),
+                "avg_latency_ms": round(
+                    self.total_latency * 1000 / self.events if self.events else 0, 4
+                ),
+                "strategies": self.runner.stats(),
+            }
@@ -0,0 +1,296 @@
+import inspect
+import math
+from abc import ABC, abstractmethod
+
+from src.Data_feed.ring_buffer import RingBuffer
+
+
+class RunningSum:
+    """Neumaier-compensated running sum supporting adds and removals"""
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value):
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    @property
+    def value(self):
+        return self.total + self.compensation
+
+
+class Indicator(ABC):
+    """Streaming indicator: update() folds in one input in O(1).
+
+    `value` holds the latest output, or None until enough inputs arrived.
+    Price indicators take a price per update; bar indicators (uses_bars)
+    take high, low and close.
+    """
+
+    uses_bars = False
+
+    def __init__(self):
+        self.value = None
+
+    @property
+    def ready(self):
+        return self.value is not None
+
+    @abstractmethod
+    def update(self, price):
+        """Fold in one input and return the new value"""
+
+
+class SMA(Indicator):
+    """Simple moving average over a compensated running sum"""
+
+    def __init__(self, period=20):
+        super().__init__()
+        self.period = period
+        self._window = RingBuffer(period)
+        self._sum = RunningSum()
+
+    def update(self, price):
+        if len(self._window) == self.period:
+            self._sum.add(-self._window[0])
+        self._window.append(price)
+        self._sum.add(price)
+        if len(self._window) == self.period:
+            self.value = self._sum.value / self.period
+        return self.value
+
+    def window(self):
+        """Read-only view of the last `period` inputs, oldest first"""
+        return self._window.last()
+
+
+class EMA(Indicator):
+    """Exponential moving average, seeded with the SMA of the first period"""
+
+    def __init__(self, period=20):
+        super().__init__()
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self._count = 0
+        self._seed = 0.0
+
+    def update(self, price):
+        if self.value is None:
+            self._count += 1
+            self._seed += price
+            if self._count == self.period:
+                self.value = self._seed / self.period
+        else:
+            self.value += self.alpha * (price - self.value)
+        return self.value
+
+
+class RSI(Indicator):
+    """Relative strength index with Wilder smoothing"""
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.period = period
+        self._previous = None
+        self._count = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, price):
+        previous, self._previous = self._previous, price
+        if previous is None:
+            return self.value
+        change = price - previous
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        if self._count < self.period:
+            # Seed the averages with simple means of the first changes
+            self._count += 1
+            self._gain += gain / self.period
+            self._loss += loss / self.period
+            if self._count < self.period:
+                return self.value
+        else:
+            self._gain += (gain - self._gain) / self.period
+            self._loss += (loss - self._loss) / self.period
+
+        if self._loss == 0:
+            self.value = 100.0 if self._gain > 0 else 50.0
+        else:
+            self.value = 100 - 100 / (1 + self._gain / self._loss)
+        return self.value
+
+
+class BollingerBands(Indicator):
+    """Middle/upper/lower bands: SMA +/- num_std population deviations.
+
+    value is a (middle, upper, lower) tuple.
+    """
+
+    def __init__(self, period=20, num_std=2.0):
+        super().__init__()
+        self.period = period
+        self.num_std = num_std
+        self._window = RingBuffer(period)
+        self._sum = RunningSum()
+        self._squares = RunningSum()
+        self._base = None  # Centring offset keeps the squares small
+
+    def update(self, price):
+        if self._base is None:
+            self._base = price
+        centred = price - self._base
+        if len(self._window) == self.period:
+            oldest = self._window[0]
+            self._sum.add(-oldest)
+            self._squares.add(-oldest * oldest)
+        self._window.append(centred)
+        self._sum.add(centred)
+        self._squares.add(centred * centred)
+        if len(self._window) < self.period:
+            return self.value
+
+        mean = self._sum.value / self.period
+        variance = max(0.0, self._squares.value / self.period - mean * mean)
+        width = self.num_std * math.sqrt(variance)
+        middle = mean + self._base
+        self.value = (middle, middle + width, middle - width)
+        return self.value
+
+
+class MACD(Indicator):
+    """MACD line, signal line and histogram from fast/slow/signal EMAs.
+
+    value is a (macd, signal, histogram) tuple.
+    """
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        super().__init__()
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+
+    def update(self, price):
+        fast = self.fast.update(price)
+        slow = self.slow.update(price)
+        if fast is None or slow is None:
+            return self.value
+        macd = fast - slow
+        signal = self.signal.update(macd)
+        if signal is not None:
+            self.value = (macd, signal, macd - signal)
+        return self.value
+
+
+class ATR(Indicator):
+    """Average true range with Wilder smoothing, fed with bars"""
+
+    uses_bars = True
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.period = period
+        self._previous_close = None
+        self._count = 0
+        self._seed = 0.0
+
+    def update(self, high, low, close):
+        previous_close, self._previous_close = self._previous_close, close
+        true_range = high - low
+        if previous_close is not None:
+            true_range = max(
+                true_range, abs(high - previous_close), abs(low - previous_close)
+            )
+
+        if self.value is None:
+            self._count += 1
+            self._seed += true_range
+            if self._count == self.period:
+                self.value = self._seed / self.period
+        else:
+            self.value += (true_range - self.value) / self.period
+        return self.value
+
+
+INDICATORS = {
+    "sma": SMA,
+    "ema": EMA,
+    "rsi": RSI,
+    "bollinger": BollingerBands,
+    "macd": MACD,
+    "atr": ATR,
+}
+
+
+class IndicatorRegistry:
+    """Shared indicator instances keyed by (symbol, name, params).
+
+    Any number of strategies asking for the same indicator get the same
+    instance, and update()/update_bar() advance each instance once per tick
+    or bar no matter how many consumers it has.
+    """
+
+    def __init__(self):
+        self._indicators = {}  # (symbol, name, params) -> Indicator
+        self._by_symbol = {}  # symbol -> ([price indicators], [bar indicators])
+        self._last_sequence = {}  # (symbol, kind) -> last sequence applied
+
+    @staticmethod
+    def key(symbol, name, *args, **kwargs):
+        """Canonical key: positional, keyword and default params bind alike"""
+        cls = INDICATORS[name]
+        bound = inspect.signature(cls).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (symbol, name, tuple(bound.arguments.items()))
+
+    def get(self, symbol, name, *args, **kwargs):
+        """Return the shared indicator, creating it on first request"""
+        key = self.key(symbol, name, *args, **kwargs)
+        indicator = self._indicators.get(key)
+        if indicator is None:
+            indicator = INDICATORS[name](*args, **kwargs)
+            self._indicators[key] = indicator
+            price_list, bar_list = self._by_symbol.setdefault(symbol, ([], []))
+            (bar_list if indicator.uses_bars else price_list).append(indicator)
+        return indicator
+
+    def __len__(self):
+        return len(self._indicators)
+
+    def _is_new(self, symbol, kind, sequence):
+        if sequence is None:
+            return True
+        key = (symbol, kind)
+        if self._last_sequence.get(key) == sequence:
+            return False
+        self._last_sequence[key] = sequence
+        return True
+
+    def update(self, symbol, price, sequence=None):
+        """
+        Advance every price indicator of a symbol by one tick.
+
+        Args:
+            sequence: Optional tick id; a repeated id is ignored, so several
+                callers may forward the same tick safely
+        """
+        indicators = self._by_symbol.get(symbol)
+        if indicators and self._is_new(symbol, "price", sequence):
+            for indicator in indicators[0]:
+                indicator.update(price)
+
+    def update_bar(self, symbol, bar, sequence=None):
+        """Advance every bar indicator of a symbol with a closed Bar"""
+        indicators = self._by_symbol.get(symbol)
+        if indicators and self._is_new(symbol, "bar", sequence):
+            for indicator in indicators[1]:
+                indicator.update(bar.high, bar.low, bar.close)
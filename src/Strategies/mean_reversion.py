@@ -0,0 +1,285 @@
+import argparse
+import math
+from collections import deque
+
+import numpy as np
+
+from src.Data_feed.ring_buffer import RingBuffer
+from src.Strategies.backtester import load_price_series, rolling_mean
+from src.Strategies.indicators import RunningSum
+
+# Batch signal codes
+NO_SIGNAL = 0
+LONG_SPREAD = 1  # Long asset A, short asset B
+SHORT_SPREAD = -1  # Short asset A, long asset B
+EXIT = 2
+
+
+def format_signal(code, spread, asset_a="BTC", asset_b="ETH"):
+    """Signal line in the mean_reversion_results.txt format"""
+    if code == SHORT_SPREAD:
+        return f"Short {asset_a}, Long {asset_b}: Spread = {spread}"
+    if code == LONG_SPREAD:
+        return f"Long {asset_a}, Short {asset_b}: Spread = {spread}"
+    if code == EXIT:
+        return f"Exit Position: Spread = {spread}"
+    return None
+
+
+def signal_code(zscore, entry_z, exit_z):
+    """Map a spread z-score to a signal code"""
+    if zscore > entry_z:
+        return SHORT_SPREAD
+    if zscore < -entry_z:
+        return LONG_SPREAD
+    if abs(zscore) < exit_z:
+        return EXIT
+    return NO_SIGNAL
+
+
+class PairsTradingStrategy:
+    """Mean-reversion strategy on the spread between two assets.
+
+    The spread is ``price_a - hedge_ratio * price_b``, 1:1 by default; with
+    hedge_ratio=None it is the rolling OLS slope of A on B. When the spread's
+    z-score over the window rises above entry_z, A is rich against B (short
+    A, long B). Below -entry_z the reverse trade is signalled, and inside
+    +/- exit_z an exit is signalled.
+
+    Running sums of a, b, a*a, b*b and a*b (centred on the first prices so
+    squares stay small) make each update O(1) whatever the window length.
+    """
+
+    def __init__(
+        self,
+        window=20,
+        entry_z=1.0,
+        exit_z=0.5,
+        hedge_ratio=1.0,
+        products=("BTC-USD", "ETH-USD"),
+        history=500,
+    ):
+        """
+        Args:
+            window: Number of synchronized price pairs in the rolling window
+            entry_z: Z-score beyond which a position is signalled
+            exit_z: Z-score inside which an exit is signalled
+            hedge_ratio: Fixed hedge ratio (1:1 by default, as in the CLI),
+                or None for the rolling OLS slope
+            products: Product ids of legs A and B; their base currencies
+                name the assets in the signal text
+            history: Number of recent signal texts kept in self.signals
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+        self.fixed_hedge_ratio = hedge_ratio
+        self.products = tuple(products)
+        self.asset_a, self.asset_b = (p.split("-")[0] for p in self.products)
+
+        self._a = RingBuffer(window)
+        self._b = RingBuffer(window)
+        self._sums = [RunningSum() for _ in range(5)]  # a, b, aa, bb, ab
+        self._base_a = None
+        self._base_b = None
+        self._latest = {}  # product_id -> last price, for on_tick
+
+        self.hedge_ratio = hedge_ratio
+        self.spread = None
+        self.zscore = None
+        self.position = None  # None, 'long_spread' or 'short_spread'
+        self.signals = deque(maxlen=history)
+
+    def _add(self, a, b, sign):
+        sum_a, sum_b, sum_aa, sum_bb, sum_ab = self._sums
+        sum_a.add(sign * a)
+        sum_b.add(sign * b)
+        sum_aa.add(sign * a * a)
+        sum_bb.add(sign * b * b)
+        sum_ab.add(sign * a * b)
+
+    def update(self, price_a, price_b):
+        """
+        Feed one synchronized price pair.
+
+        Returns:
+            Signal text (see format_signal), or None during warm-up and
+            between the exit and entry bands
+        """
+        if self._base_a is None:
+            self._base_a = price_a
+            self._base_b = price_b
+        a = price_a - self._base_a
+        b = price_b - self._base_b
+
+        if len(self._a) == self.window:
+            self._add(self._a[0], self._b[0], -1)
+        self._a.append(a)
+        self._b.append(b)
+        self._add(a, b, 1)
+        if len(self._a) < self.window:
+            return None
+
+        n = self.window
+        sum_a, sum_b, sum_aa, sum_bb, sum_ab = (s.value for s in self._sums)
+        mean_a = sum_a / n
+        mean_b = sum_b / n
+        var_a = sum_aa / n - mean_a * mean_a
+        var_b = sum_bb / n - mean_b * mean_b
+        cov = sum_ab / n - mean_a * mean_b
+
+        beta = self.fixed_hedge_ratio
+        if beta is None:
+            if var_b <= 0:
+                return None
+            beta = cov / var_b
+        spread_var = var_a - 2 * beta * cov + beta * beta * var_b
+        if spread_var <= 0:
+            return None
+
+        self.hedge_ratio = beta
+        self.spread = price_a - beta * price_b
+        self.zscore = ((a - beta * b) - (mean_a - beta * mean_b)) / math.sqrt(
+            spread_var
+        )
+        code = signal_code(self.zscore, self.entry_z, self.exit_z)
+        if code == NO_SIGNAL:
+            return None
+
+        if code == EXIT:
+            self.position = None
+        else:
+            self.position = "long_spread" if code == LONG_SPREAD else "short_spread"
+        signal = format_signal(code, self.spread, self.asset_a, self.asset_b)
+        self.signals.append(signal)
+        return signal
+
+    def on_tick(self, product_id, price):
+        """
+        Feed one product's tick; updates once both legs have a price.
+
+        Each tick pairs with the other leg's latest price (an as-of join).
+        """
+        if product_id not in self.products:
+            return None
+        self._latest[product_id] = price
+        if len(self._latest) < 2:
+            return None
+        return self.update(
+            self._latest[self.products[0]], self._latest[self.products[1]]
+        )
+
+    def run(self, prices_a, prices_b):
+        """
+        Vectorized batch mode over aligned historical price arrays.
+
+        Returns:
+            Dict of arrays aligned with the inputs: hedge_ratio, spread,
+            zscore (NaN during warm-up) and signal codes (int8)
+        """
+        prices_a = np.asarray(prices_a, dtype=np.float64)
+        prices_b = np.asarray(prices_b, dtype=np.float64)
+        if len(prices_a) == 0:
+            empty = np.empty(0)
+            return {
+                "hedge_ratio": empty,
+                "spread": empty,
+                "zscore": empty,
+                "signal": np.empty(0, dtype=np.int8),
+            }
+        a = prices_a - prices_a[0]
+        b = prices_b - prices_b[0]
+        window = self.window
+
+        mean_a = rolling_mean(a, window)
+        mean_b = rolling_mean(b, window)
+        var_a = rolling_mean(a * a, window) - mean_a * mean_a
+        var_b = rolling_mean(b * b, window) - mean_b * mean_b
+        cov = rolling_mean(a * b, window) - mean_a * mean_b
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.fixed_hedge_ratio is None:
+                beta = np.where(var_b > 0, cov / var_b, np.nan)
+            else:
+                beta = np.where(np.isnan(mean_a), np.nan, self.fixed_hedge_ratio)
+            spread_var = var_a - 2 * beta * cov + beta * beta * var_b
+            spread_var = np.where(spread_var > 0, spread_var, np.nan)
+            zscore = ((a - beta * b) - (mean_a - beta * mean_b)) / np.sqrt(spread_var)
+            spread = prices_a - beta * prices_b
+
+        valid = ~np.isnan(zscore)
+        signal = np.zeros(len(zscore), dtype=np.int8)
+        signal[valid & (zscore > self.entry_z)] = SHORT_SPREAD
+        signal[valid & (zscore < -self.entry_z)] = LONG_SPREAD
+        signal[valid & (np.abs(zscore) < self.exit_z)] = EXIT
+        return {"hedge_ratio": beta, "spread": spread, "zscore": zscore, "signal": signal}
+
+    def signal_lines(self, result):
+        """Signal texts of a run() result, in order"""
+        return [
+            format_signal(int(code), spread.item(), self.asset_a, self.asset_b)
+            for code, spread in zip(
+                result["signal"][result["signal"] != NO_SIGNAL],
+                result["spread"][result["signal"] != NO_SIGNAL],
+            )
+        ]
+
+
+def align_series(times_a, prices_a, times_b, prices_b):
+    """
+    As-of join of two tick series onto their merged timestamps.
+
+    Each output row pairs the latest price of both legs at that time,
+    starting once both legs have ticked.
+
+    Returns:
+        (times, prices_a, prices_b)
+    """
+    times_a = np.asarray(times_a)
+    times_b = np.asarray(times_b)
+    times = np.union1d(times_a, times_b)
+    index_a = np.searchsorted(times_a, times, side="right") - 1
+    index_b = np.searchsorted(times_b, times, side="right") - 1
+    ready = (index_a >= 0) & (index_b >= 0)
+    return (
+        times[ready],
+        np.asarray(prices_a)[index_a[ready]],
+        np.asarray(prices_b)[index_b[ready]],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pairs mean-reversion signals")
+    parser.add_argument("source", help="ticker CSV file or tick store directory")
+    parser.add_argument("--pair", nargs=2, default=["BTC-USD", "ETH-USD"])
+    parser.add_argument("--window", type=int, default=20)
+    parser.add_argument("--entry-z", type=float, default=1.0)
+    parser.add_argument("--exit-z", type=float, default=0.5)
+    # The default 1:1 spread is the one mean_reversion_results.txt was
+    # produced with
+    parser.add_argument(
+        "--hedge-ratio",
+        default="1",
+        help="fixed hedge ratio, or 'rolling' for a rolling OLS estimate",
+    )
+    parser.add_argument("--output", default="mean_reversion_signals.txt")
+    args = parser.parse_args()
+    hedge_ratio = None if args.hedge_ratio == "rolling" else float(args.hedge_ratio)
+
+    leg_a = load_price_series(args.source, args.pair[0])
+    leg_b = load_price_series(args.source, args.pair[1])
+    _, aligned_a, aligned_b = align_series(leg_a[1], leg_a[0], leg_b[1], leg_b[0])
+
+    strategy = PairsTradingStrategy(
+        args.window,
+        args.entry_z,
+        args.exit_z,
+        hedge_ratio,
+        args.pair,
+    )
+    lines = strategy.signal_lines(strategy.run(aligned_a, aligned_b))
+    with open(args.output, "w") as f:
+        f.writelines(line + "\n" for line in lines)
+    print(f"Wrote {len(lines)} signals to {args.output}")
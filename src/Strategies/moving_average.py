@@ -1,33 +1,110 @@
+import math
+
+from src.Data_feed.ring_buffer import RingBuffer
+from src.Strategies.indicators import IndicatorRegistry
+from src.Strategies.performance import TradeStats
+from src.Strategies.trade_ledger import TradeLedger
+from src.utils.fees_calculator import FeeSchedule
+
+
+def window_mean(prices, window):
+    """Exact mean of the last `window` prices (correctly rounded via fsum)"""
+    return math.fsum(prices[len(prices) - window :]) / window
+
+
+def crossover_signal(short_ma, long_ma):
+    """Map a short/long MA pair to 'buy', 'sell' or None"""
+    if short_ma > long_ma:
+        return "buy"
+    elif short_ma < long_ma:
+        return "sell"
+    return None
+
+
 class MovingAverageStrategy:
+    # Relative MA gap below which update() re-derives both MAs exactly, so
+    # rounding in the running sums can never flip a signal
+    exact_tolerance = 1e-9
+
     def __init__(
-        self, short_window=10, long_window=50, trading_fee=0.0001  # Reduced to 0.01%
+        self,
+        short_window=10,
+        long_window=50,
+        trading_fee=0.0001,  # Reduced to 0.01%
+        fee_schedule=None,
+        indicators=None,
+        symbol="BTC-USD",
     ):
         self.short_window = short_window
         self.long_window = long_window
         self.trading_fee = trading_fee  # 0.01% per trade
+        # Fees and taxes; defaults to a flat trading_fee with no tax
+        self.fee_schedule = fee_schedule or FeeSchedule.flat(trading_fee)
+        self.volume_30d = 0  # Selects the fee tier; set by StrategyEngine
+        self.total_taxes_paid = 0
 
         # Trade tracking
-        self.trades = []
+        self.trades = TradeLedger()
         self.position = None  # None = no position, 'long' = holding coins
         self.entry_price = None
         self.current_balance = 0
         self.initial_balance = 0
         self.total_fees_paid = 0
         self.reset_threshold = 900  # Balance reset threshold
+        self.stats = TradeStats()  # Running aggregates behind the metrics
+
+        # Streaming SMAs for update(), from a private registry unless one
+        # shared with other consumers of the symbol is passed in
+        self.indicators = IndicatorRegistry() if indicators is None else indicators
+        self.symbol = symbol
+        self._short = self.indicators.get(symbol, "sma", short_window)
+        self._long = self.indicators.get(symbol, "sma", long_window)
+        self.short_ma = None
+        self.long_ma = None
 
     def calculate_signals(self, prices):
-        """Calculate buy/sell signals based on moving average crossover."""
+        """Calculate buy/sell signals based on moving average crossover.
+
+        Args:
+            prices: Price history as a RingBuffer, NumPy array or sequence
+        """
         if len(prices) < self.long_window:
             return None
 
-        short_ma = sum(prices[-self.short_window :]) / self.short_window
-        long_ma = sum(prices[-self.long_window :]) / self.long_window
+        if isinstance(prices, RingBuffer):
+            prices = prices.last()
+        short_ma = window_mean(prices, self.short_window)
+        long_ma = window_mean(prices, self.long_window)
+        return crossover_signal(short_ma, long_ma)
+
+    def update(self, price, sequence=None):
+        """
+        Feed one price and return the crossover signal in O(1).
+
+        Both MAs are SMA indicators over compensated running sums, so the
+        cost per price does not depend on the window lengths. Signals are
+        identical to calling calculate_signals() on the full price history.
+
+        Args:
+            sequence: Tick id forwarded to a shared registry, so indicators
+                shared with other strategies advance once per tick
+        """
+        self.indicators.update(self.symbol, price, sequence)
+        short_ma = self._short.value
+        long_ma = self._long.value
+        if short_ma is None or long_ma is None:
+            return None
 
-        if short_ma > long_ma:
-            return "buy"
-        elif short_ma < long_ma:
-            return "sell"
-        return None
+        if abs(short_ma - long_ma) <= self.exact_tolerance * max(
+            abs(short_ma), abs(long_ma)
+        ):
+            # Too close to call from the running sums; settle it exactly
+            values = max(self._short, self._long, key=lambda sma: sma.period).window()
+            short_ma = window_mean(values, self.short_window)
+            long_ma = window_mean(values, self.long_window)
+        self.short_ma = short_ma
+        self.long_ma = long_ma
+        return crossover_signal(short_ma, long_ma)
 
     def execute_trade(self, signal, current_price, timestamp, investment_amount=1000):
         """
@@ -42,63 +119,69 @@ class MovingAverageStrategy:
         if self.initial_balance == 0:
             self.initial_balance = investment_amount
             self.current_balance = investment_amount
+            self.stats = TradeStats(investment_amount)
 
         if signal == "buy" and self.position is None:
             # Calculate how many coins we can buy with our investment amount
-            fee = investment_amount * self.trading_fee
+            fee = self.fee_schedule.fee(investment_amount, self.volume_30d)
             coins = (investment_amount - fee) / current_price
 
             self.position = "long"
             self.entry_price = current_price
             self.total_fees_paid += fee
-
-            trade = {
-                "type": "buy",
-                "price": current_price,
-                "coins": coins,
-                "timestamp": timestamp,
-                "fee": fee,
-                "investment": investment_amount,
-            }
-            self.trades.append(trade)
+            self.trades.record_buy(
+                current_price, coins, timestamp, fee, investment_amount
+            )
 
         elif signal == "sell" and self.position == "long":
-            # Find the last buy trade to calculate coins to sell
-            last_buy = next(
-                trade for trade in reversed(self.trades) if trade["type"] == "buy"
-            )
-            coins_to_sell = last_buy["coins"]
+            # The open buy being closed gives the coins to sell
+            entry = self.trades.open_position()
+            coins_to_sell = self.trades.value("coins", entry)
+            investment = self.trades.value("investment", entry)
 
             # Calculate sale proceeds
             gross_proceeds = coins_to_sell * current_price
-            fee = gross_proceeds * self.trading_fee
+            fee = self.fee_schedule.fee(gross_proceeds, self.volume_30d)
+            tax = self.fee_schedule.tax(gross_proceeds - fee - investment)
 
-            net_proceeds = gross_proceeds - fee
+            net_proceeds = gross_proceeds - fee - tax
+            profit_loss = net_proceeds - investment
 
             self.current_balance = net_proceeds
             self.total_fees_paid += fee
+            self.total_taxes_paid += tax
             self.position = None
-
-            trade = {
-                "type": "sell",
-                "price": current_price,
-                "coins": coins_to_sell,
-                "timestamp": timestamp,
-                "fee": fee,
-                "gross_proceeds": gross_proceeds,
-                "net_proceeds": net_proceeds,
-                "profit_loss": net_proceeds - last_buy["investment"],
-            }
-            self.trades.append(trade)
+            self.stats.record_close(profit_loss, investment)
+            self.trades.record_sell(
+                current_price,
+                coins_to_sell,
+                timestamp,
+                fee,
+                gross_proceeds,
+                net_proceeds,
+                profit_loss,
+                tax,
+            )
 
     def get_performance_metrics(self):
-        """Calculate and return comprehensive performance metrics."""
+        """Return comprehensive performance metrics.
+
+        Constant time: everything is read from running aggregates that
+        execute_trade maintains, so no trade list is scanned.
+
+        total_profit_loss and return_percentage compare current_balance,
+        the net proceeds of the last sell, with the investment, so they
+        describe the latest round trip only. realized_profit_loss (from
+        TradeStats) is the cumulative net P&L of every closed trade since
+        the last reset.
+        """
         if not self.trades:
             return {
                 "total_trades": 0,
                 "current_balance": self.initial_balance,
                 "total_profit_loss": 0,
                 "total_fees": 0,
+                "total_taxes": 0,
                 "return_percentage": 0,
                 "position": "No position",
             }
@@ -111,8 +194,10 @@ class MovingAverageStrategy:
             self.current_balance = self.initial_balance
             self.position = None
             self.entry_price = None
-            self.trades = []
+            self.trades.clear()
             self.total_fees_paid = 0
+            self.total_taxes_paid = 0
+            self.stats = TradeStats(self.initial_balance)
 
         total_profit_loss = self.current_balance - self.initial_balance
 
@@ -121,52 +206,27 @@ class MovingAverageStrategy:
             "current_balance": round(self.current_balance, 2),
             "total_profit_loss": round(total_profit_loss, 2),
             "total_fees": round(self.total_fees_paid, 2),
+            "total_taxes": round(self.total_taxes_paid, 2),
             "return_percentage": round(
                 (total_profit_loss / self.initial_balance) * 100, 2
             ),
             "position": self.position if self.position else "No position",
         }
 
-        # Calculate win rate
         if len(self.trades) > 0:
-            profitable_trades = sum(
-                1
-                for trade in self.trades
-                if trade.get("type") == "sell" and trade.get("profit_loss", 0) > 0
-            )
-            total_closed_trades = sum(
-                1 for trade in self.trades if trade.get("type") == "sell"
-            )
-
-            if total_closed_trades > 0:
-                metrics["win_rate"] = round(
-                    (profitable_trades / total_closed_trades) * 100, 2
-                )
-            else:
-                metrics["win_rate"] = 0
+            metrics["win_rate"] = round(self.stats.win_rate, 2)
+        metrics.update(self.stats.to_dict())
 
         return metrics
 
-    def get_trade_history(self):
-        """Return formatted trade history with key metrics for each trade."""
-        formatted_trades = []
-        for trade in self.trades:
-            formatted_trade = {
-                "timestamp": trade["timestamp"],
-                "type": trade["type"],
-                "price": round(trade["price"], 2),
-                "coins": round(trade["coins"], 8),
-                "fee": round(trade["fee"], 2),
-            }
-
-            if trade["type"] == "sell":
-                formatted_trade.update(
-                    {
-                        "profit_loss": round(trade["profit_loss"], 2),
-                        "net_proceeds": round(trade["net_proceeds"], 2),
-                    }
-                )
+    def get_trade_history(self, limit=None, offset=0):
+        """Return formatted trade history with key metrics for each trade.
 
-            formatted_trades.append(formatted_trade)
+        Args:
+            limit: Only the newest `limit` trades (all when None)
+            offset: Skip this many of the newest trades first
 
-        return formatted_trades
+        Returns:
+            Formatted trades, oldest first
+        """
+        return self.trades.history(offset, limit)[::-1]
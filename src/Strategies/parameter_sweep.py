@@ -0,0 +1,201 @@
+import argparse
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.Strategies.backtester import (
+    BacktestResult,
+    crossover_signals,
+    load_price_series,
+    rolling_mean,
+)
+
+# Columns of the ranked table, in print order. realized_profit_loss sums
+# every closed round trip; total_profit_loss and return_percentage only
+# reflect the last one (current_balance is the last sell's net proceeds)
+RESULT_COLUMNS = (
+    "short_window",
+    "long_window",
+    "trading_fee",
+    "investment_amount",
+    "total_trades",
+    "realized_profit_loss",
+    "total_profit_loss",
+    "return_percentage",
+    "win_rate",
+    "total_fees",
+)
+
+# Per-worker views onto the shared blocks, set by _attach
+_shared = {}
+
+
+def _attach(price_name, ma_name, n, windows):
+    """Pool initializer: map the shared price and moving-average blocks"""
+    prices_block = shared_memory.SharedMemory(name=price_name)
+    ma_block = shared_memory.SharedMemory(name=ma_name)
+    _shared["blocks"] = (prices_block, ma_block)  # Keep the mappings alive
+    _shared["prices"] = np.ndarray((n,), dtype=np.float64, buffer=prices_block.buf)
+    _shared["ma"] = np.ndarray(
+        (len(windows), n), dtype=np.float64, buffer=ma_block.buf
+    )
+    _shared["row"] = {window: row for row, window in enumerate(windows)}
+
+
+def _compute_ma(window):
+    """Fill the shared row of one window; each window is computed once"""
+    _shared["ma"][_shared["row"][window]] = rolling_mean(_shared["prices"], window)
+    return window
+
+
+def _evaluate_pair(short_window, long_window, fees, investments):
+    """Backtest one window pair across every fee and investment amount.
+
+    Signals depend only on the windows, so they are derived once and
+    reused for each fee/investment combination.
+    """
+    prices = _shared["prices"]
+    ma = _shared["ma"]
+    row = _shared["row"]
+    signals, short_ma, long_ma = crossover_signals(
+        prices,
+        short_window,
+        long_window,
+        ma[row[short_window]],
+        ma[row[long_window]],
+    )
+    signals[prices <= 0] = 0
+    times = np.arange(len(prices))
+
+    results = []
+    for fee, investment in itertools.product(fees, investments):
+        result = BacktestResult(
+            prices, times, signals, short_ma, long_ma, investment, fee
+        )
+        metrics = result.metrics()
+        metrics.setdefault("win_rate", 0)
+        metrics.setdefault("realized_profit_loss", 0)
+        metrics.update(
+            short_window=short_window,
+            long_window=long_window,
+            trading_fee=fee,
+            investment_amount=investment,
+        )
+        results.append(metrics)
+    return results
+
+
+def parameter_sweep(
+    prices,
+    short_windows,
+    long_windows,
+    fees=(0.0001,),
+    investments=(1000,),
+    workers=None,
+    sort_by="realized_profit_loss",
+):
+    """
+    Backtest every (short, long, fee, investment) combination in parallel.
+
+    Prices are placed in shared memory once and mapped by every worker, so
+    they are never pickled per task. Moving averages are computed once per
+    distinct window into a shared matrix and reused by all pairs that need
+    them. Pairs with short >= long are skipped.
+
+    Args:
+        prices: Price array
+        short_windows, long_windows: Window lengths to combine
+        fees: Trading fee rates
+        investments: Investment amounts per trade
+        workers: Process count (defaults to the CPU count)
+        sort_by: Metric to rank by, highest first (defaults to the
+            cumulative P&L over all closed trades)
+
+    Returns:
+        List of metrics dicts (see RESULT_COLUMNS), best first
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    pairs = [
+        (short, long)
+        for short in sorted(set(short_windows))
+        for long in sorted(set(long_windows))
+        if short < long
+    ]
+    if not pairs or len(prices) == 0:
+        return []
+    windows = sorted({window for pair in pairs for window in pair})
+    fees = list(fees)
+    investments = list(investments)
+
+    n = len(prices)
+    price_block = shared_memory.SharedMemory(create=True, size=prices.nbytes)
+    ma_block = shared_memory.SharedMemory(
+        create=True, size=len(windows) * prices.nbytes
+    )
+    try:
+        np.ndarray(prices.shape, dtype=np.float64, buffer=price_block.buf)[:] = prices
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_attach,
+            initargs=(price_block.name, ma_block.name, n, windows),
+        ) as pool:
+            list(pool.map(_compute_ma, windows))
+            results = []
+            for pair_results in pool.map(
+                _evaluate_pair,
+                [short for short, _ in pairs],
+                [long for _, long in pairs],
+                itertools.repeat(fees),
+                itertools.repeat(investments),
+            ):
+                results.extend(pair_results)
+    finally:
+        price_block.close()
+        price_block.unlink()
+        ma_block.close()
+        ma_block.unlink()
+
+    results.sort(key=lambda metrics: metrics[sort_by], reverse=True)
+    return results
+
+
+def format_table(results, top=None):
+    """Render sweep results as a fixed-width text table"""
+    rows = results[:top] if top else results
+    cells = [[str(metrics[column]) for column in RESULT_COLUMNS] for metrics in rows]
+    widths = [
+        max([len(column)] + [len(row[i]) for row in cells])
+        for i, column in enumerate(RESULT_COLUMNS)
+    ]
+    lines = ["  ".join(c.rjust(w) for c, w in zip(RESULT_COLUMNS, widths))]
+    lines.extend("  ".join(c.rjust(w) for c, w in zip(row, widths)) for row in cells)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep MovingAverageStrategy parameters")
+    parser.add_argument("source", help="ticker CSV file or tick store directory")
+    parser.add_argument("--product", default="BTC-USD")
+    parser.add_argument("--short", type=int, nargs="+", default=[5, 10, 20])
+    parser.add_argument("--long", type=int, nargs="+", default=[30, 50, 100])
+    parser.add_argument("--fees", type=float, nargs="+", default=[0.0001])
+    parser.add_argument("--investments", type=float, nargs="+", default=[1000])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--sort-by", default="realized_profit_loss")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    series_prices, _, _ = load_price_series(args.source, args.product)
+    sweep = parameter_sweep(
+        series_prices,
+        args.short,
+        args.long,
+        args.fees,
+        args.investments,
+        args.workers,
+        args.sort_by,
+    )
+    print(format_table(sweep, args.top))
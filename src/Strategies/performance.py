@@ -0,0 +1,112 @@
+import math
+
+
+class TradeStats:
+    """Running trade aggregates, updated in O(1) per closed trade.
+
+    Equity is the starting balance plus realized net P&L; drawdown is
+    measured from its running peak. Trade returns (P&L / investment) feed a
+    Welford mean/variance for a per-trade Sharpe estimate.
+    """
+
+    __slots__ = (
+        "initial_equity",
+        "closed_trades",
+        "winning_trades",
+        "losing_trades",
+        "gross_profit",
+        "gross_loss",
+        "realized_profit_loss",
+        "equity",
+        "peak_equity",
+        "max_drawdown",
+        "max_drawdown_percentage",
+        "return_mean",
+        "_return_m2",
+    )
+
+    def __init__(self, initial_equity=0):
+        self.initial_equity = initial_equity
+        self.closed_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.realized_profit_loss = 0.0
+        self.equity = initial_equity
+        self.peak_equity = initial_equity
+        self.max_drawdown = 0.0
+        self.max_drawdown_percentage = 0.0
+        self.return_mean = 0.0
+        self._return_m2 = 0.0
+
+    def record_close(self, profit_loss, investment):
+        """Fold one closed (sell) trade into the aggregates"""
+        self.closed_trades += 1
+        if profit_loss > 0:
+            self.winning_trades += 1
+            self.gross_profit += profit_loss
+        elif profit_loss < 0:
+            self.losing_trades += 1
+            self.gross_loss -= profit_loss
+        self.realized_profit_loss += profit_loss
+
+        self.equity = self.initial_equity + self.realized_profit_loss
+        if self.equity > self.peak_equity:
+            self.peak_equity = self.equity
+        drawdown = self.peak_equity - self.equity
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+            if self.peak_equity > 0:
+                self.max_drawdown_percentage = drawdown / self.peak_equity * 100
+
+        # Welford update of the trade-return mean and variance
+        trade_return = profit_loss / investment if investment else 0.0
+        delta = trade_return - self.return_mean
+        self.return_mean += delta / self.closed_trades
+        self._return_m2 += delta * (trade_return - self.return_mean)
+
+    @property
+    def win_rate(self):
+        """Percentage of closed trades with a profit"""
+        if not self.closed_trades:
+            return 0
+        return self.winning_trades / self.closed_trades * 100
+
+    @property
+    def return_std(self):
+        """Sample standard deviation of trade returns"""
+        if self.closed_trades < 2:
+            return 0.0
+        return math.sqrt(self._return_m2 / (self.closed_trades - 1))
+
+    @property
+    def sharpe_ratio(self):
+        """Mean trade return over its standard deviation (per trade)"""
+        std = self.return_std
+        return self.return_mean / std if std > 0 else 0.0
+
+    @property
+    def profit_factor(self):
+        """Gross profit over gross loss; None when nothing was lost"""
+        return self.gross_profit / self.gross_loss if self.gross_loss else None
+
+    def to_dict(self):
+        """Rounded aggregates for display"""
+        profit_factor = self.profit_factor
+        return {
+            "closed_trades": self.closed_trades,
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "gross_profit": round(self.gross_profit, 2),
+            "gross_loss": round(self.gross_loss, 2),
+            "realized_profit_loss": round(self.realized_profit_loss, 2),
+            "profit_factor": (
+                round(profit_factor, 2) if profit_factor is not None else None
+            ),
+            "average_return_percentage": round(self.return_mean * 100, 4),
+            "peak_equity": round(self.peak_equity, 2),
+            "max_drawdown": round(self.max_drawdown, 2),
+            "max_drawdown_percentage": round(self.max_drawdown_percentage, 2),
+            "sharpe_ratio": round(self.sharpe_ratio, 4),
+        }
@@ -0,0 +1,290 @@
+import logging
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def trade_handler(strategy, investment_amount=1000):
+    """Batch handler for strategies with update(price, sequence) and
+    execute_trade()
+
+    The tick id is forwarded so indicators shared through a registry
+    advance once per tick. The handler returns the signal of the batch's
+    last price.
+    """
+
+    def handle(product_ids, prices, times, sequences):
+        signal = None
+        for price, timestamp, sequence in zip(
+            prices.tolist(), times.tolist(), sequences.tolist()
+        ):
+            signal = strategy.update(price, sequence)
+            if signal and price > 0:
+                strategy.execute_trade(signal, price, timestamp, investment_amount)
+        return signal
+
+    return handle
+
+
+def tick_handler(strategy):
+    """Batch handler for strategies with on_tick(product_id, price)"""
+
+    def handle(product_ids, prices, times, sequences):
+        for product_id, price in zip(product_ids.tolist(), prices.tolist()):
+            strategy.on_tick(product_id, price)
+
+    return handle
+
+
+def default_handler(strategy, **kwargs):
+    """Pick the batch handler matching the strategy's interface"""
+    if hasattr(strategy, "on_batch"):
+        return strategy.on_batch
+    if hasattr(strategy, "on_tick"):
+        return tick_handler(strategy)
+    if hasattr(strategy, "update") and hasattr(strategy, "execute_trade"):
+        return trade_handler(strategy, **kwargs)
+    raise TypeError(f"No default handler for {type(strategy).__name__}")
+
+
+class StrategySlot:
+    """One registered strategy with its subscription and counters"""
+
+    def __init__(self, name, strategy, handler, symbols):
+        self.name = name
+        self.strategy = strategy
+        self.handler = handler
+        self.symbols = symbols  # None = every symbol
+        # Indicator registry the strategy reads, if any; slots sharing one
+        # are delivered in lockstep
+        self.indicators = getattr(strategy, "indicators", None)
+        self.enabled = True
+        self.batches = 0
+        self.events = 0
+        self.cpu_time = 0.0
+        self.max_batch_cpu_time = 0.0
+        self.errors = 0
+        self.last_error = None
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "batches": self.batches,
+            "events": self.events,
+            "cpu_ms": round(self.cpu_time * 1000, 3),
+            "max_batch_cpu_ms": round(self.max_batch_cpu_time * 1000, 3),
+            "cpu_us_per_event": round(
+                self.cpu_time * 1e6 / self.events if self.events else 0, 3
+            ),
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class StrategyRunner:
+    """Fans one price stream out to many strategy instances.
+
+    Prices (ticks or closed-bar closes) are buffered in arrival order,
+    numbered with a tick id, and delivered to every strategy as one
+    (product_ids, prices, times, sequences) batch of arrays, built once and
+    shared; a strategy subscribed to some symbols gets just their rows,
+    still in arrival order. Strategies sharing an IndicatorRegistry are
+    fed row by row in lockstep, so each shared indicator advances once per
+    tick and every strategy reads it at that tick. Each strategy runs inside
+    its own try/except and is disabled after max_errors failures, so one
+    broken configuration cannot stall the rest. CPU time is measured per
+    strategy. With a positive flush_interval, a daemon thread started on
+    the first submit() delivers pending prices even when the feed goes
+    quiet; call stop() to end it.
+    """
+
+    def __init__(self, batch_size=64, flush_interval=0.25, max_errors=10):
+        """
+        Args:
+            batch_size: Deliver once this many prices are pending
+            flush_interval: Deliver pending prices at least this often (s)
+            max_errors: Disable a strategy after this many failed batches
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_errors = max_errors
+        self.slots = {}
+        self._pending = ([], [], [], [])  # product_ids, prices, times, ids
+        self._sequence = 0  # Tick id of the last submitted price
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._deliver_lock = threading.Lock()  # One batch at a time, in order
+        self._flusher = None
+        self._stopped = threading.Event()
+
+    def register(self, strategy, name=None, symbols=None, handler=None, **kwargs):
+        """
+        Add a strategy.
+
+        Args:
+            name: Unique label (defaults to class name plus a counter)
+            symbols: Product ids to deliver; defaults to the strategy's
+                symbol when it has one, otherwise every product id
+            handler: Callable(product_ids, prices, times, sequences); by
+                default chosen from the strategy's interface (see
+                default_handler)
+            **kwargs: Passed to the default handler, e.g. investment_amount
+
+        Returns:
+            The slot name
+        """
+        if name is None:
+            name = f"{type(strategy).__name__}-{len(self.slots) + 1}"
+        if name in self.slots:
+            raise ValueError(f"Strategy {name!r} already registered")
+        handler = handler or default_handler(strategy, **kwargs)
+        if symbols is None and getattr(strategy, "symbol", None) is not None:
+            symbols = [strategy.symbol]
+        symbols = None if symbols is None else frozenset(symbols)
+        self.slots[name] = StrategySlot(name, strategy, handler, symbols)
+        return name
+
+    def unregister(self, name):
+        self.slots.pop(name, None)
+
+    def submit(self, product_id, price, timestamp):
+        """Queue one price; delivers when the batch or interval is due"""
+        if self._flusher is None and self.flush_interval > 0:
+            self._start_flusher()
+        with self._lock:
+            product_ids, prices, times, sequences = self._pending
+            self._sequence += 1
+            product_ids.append(product_id)
+            prices.append(price)
+            times.append(timestamp)
+            sequences.append(self._sequence)
+            due = (
+                len(prices) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def on_bar(self, product_id, interval, bar):
+        """Stream bar-listener entry point: delivers the bar's close"""
+        self.submit(product_id, bar.close, bar.start)
+
+    def attach(self, stream, interval=None):
+        """Feed closed bars of one interval (all when None) from a stream"""
+
+        def listener(product_id, bar_interval, bar):
+            if interval is None or bar_interval == interval:
+                self.on_bar(product_id, bar_interval, bar)
+
+        stream.add_bar_listener(listener)
+        return listener
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="strategy-flusher", daemon=True
+            )
+        self._flusher.start()
+
+    def _run_flusher(self):
+        """Deliver prices left pending for flush_interval by a quiet feed"""
+        while not self._stopped.wait(self.flush_interval):
+            with self._lock:
+                due = bool(self._pending[0]) and (
+                    time.monotonic() - self._last_flush >= self.flush_interval
+                )
+            if due:
+                self.flush()
+
+    def stop(self):
+        """Stop the flusher thread and deliver whatever is still pending"""
+        self._stopped.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+
+    def flush(self):
+        """Deliver pending prices to the subscribed strategies"""
+        with self._deliver_lock:
+            with self._lock:
+                pending, self._pending = self._pending, ([], [], [], [])
+                self._last_flush = time.monotonic()
+            if pending[0]:
+                self._deliver_batch(pending)
+
+    def _deliver_batch(self, pending):
+
+        batch = (
+            np.asarray(pending[0]),
+            np.asarray(pending[1], dtype=np.float64),
+            np.asarray(pending[2]),
+            np.asarray(pending[3], dtype=np.int64),
+        )
+        for column in batch:
+            column.flags.writeable = False
+
+        slots = [slot for slot in self.slots.values() if slot.enabled]
+        groups = {}  # id(registry) -> slots sharing it
+        for slot in slots:
+            if slot.indicators is not None:
+                groups.setdefault(id(slot.indicators), []).append(slot)
+        lockstep = [group for group in groups.values() if len(group) > 1]
+        in_lockstep = {id(slot) for group in lockstep for slot in group}
+
+        subsets = {None: batch}  # symbols -> rows of the batch, built once
+        for slot in slots:
+            if id(slot) in in_lockstep:
+                continue
+            subset = subsets.get(slot.symbols)
+            if subset is None:
+                selected = np.isin(batch[0], list(slot.symbols))
+                subset = subsets[slot.symbols] = tuple(
+                    column[selected] for column in batch
+                )
+            if len(subset[1]):
+                self._deliver(slot, *subset)
+
+        for group in lockstep:
+            self._deliver_lockstep(group, batch)
+
+    def _deliver_lockstep(self, group, batch):
+        """Deliver a batch one row at a time, to every slot of the group"""
+        for i, product_id in enumerate(batch[0].tolist()):
+            row = tuple(column[i : i + 1] for column in batch)
+            for slot in group:
+                if slot.enabled and (
+                    slot.symbols is None or product_id in slot.symbols
+                ):
+                    self._deliver(slot, *row)
+
+    def _deliver(self, slot, product_ids, prices, times, sequences):
+        start = time.thread_time()
+        try:
+            slot.handler(product_ids, prices, times, sequences)
+        except Exception as e:
+            slot.errors += 1
+            slot.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"Strategy {slot.name} failed: {slot.last_error}")
+            if slot.errors >= self.max_errors:
+                slot.enabled = False
+                logger.error(f"Strategy {slot.name} disabled after {slot.errors} errors")
+        finally:
+            elapsed = time.thread_time() - start
+            slot.cpu_time += elapsed
+            slot.max_batch_cpu_time = max(slot.max_batch_cpu_time, elapsed)
+            slot.batches += 1
+            slot.events += len(prices)
+
+    def stats(self):
+        """Per-strategy counters, most CPU-expensive first"""
+        return sorted(
+            (slot.stats() for slot in self.slots.values()),
+            key=lambda stats: stats["cpu_ms"],
+            reverse=True,
+        )
@@ -0,0 +1,189 @@
+import numpy as np
+
+TRADE_TYPES = {1: "buy", -1: "sell"}
+
+# Column name -> dtype; sell-only columns are NaN on buy rows and vice versa
+LEDGER_COLUMNS = (
+    ("side", np.int8),  # 1 = buy, -1 = sell
+    ("price", np.float64),
+    ("coins", np.float64),
+    ("timestamp", np.int64),  # Epoch ms
+    ("fee", np.float64),
+    ("investment", np.float64),
+    ("gross_proceeds", np.float64),
+    ("net_proceeds", np.float64),
+    ("profit_loss", np.float64),
+    ("tax", np.float64),
+    ("entry", np.int64),  # Row of the buy a sell closed, -1 on buys
+)
+
+
+class TradeLedger:
+    """Array-backed, append-only trade log.
+
+    Trades are stored column-wise in NumPy arrays that double when full, so
+    appends are amortized O(1) with no per-trade dict. Open buys are kept
+    on a stack, making the matching buy for a sell an O(1) lookup. Rows
+    never change once written, so formatted history rows are built once
+    and cached.
+    """
+
+    def __init__(self, capacity=256):
+        self._size = 0
+        self.total = 0  # Trades ever recorded; not reset by clear()
+        self._columns = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in LEDGER_COLUMNS
+        }
+        self._open = []  # Row indices of unclosed buys, newest last
+        self._formatted = []  # Cached history rows, by row index
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, key):
+        """Trade dict(s) in MovingAverageStrategy's original format"""
+        if isinstance(key, slice):
+            return [self.trade(i) for i in range(*key.indices(self._size))]
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("trade index out of range")
+        return self.trade(key)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self.trade(i)
+
+    def column(self, name):
+        """Read-only view of one column over the recorded trades"""
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def _append(self, **values):
+        if self._size == len(self._columns["side"]):
+            for name, values_array in self._columns.items():
+                grown = np.empty(2 * len(values_array), dtype=values_array.dtype)
+                grown[: self._size] = values_array[: self._size]
+                self._columns[name] = grown
+        row = self._size
+        for name, values_array in self._columns.items():
+            values_array[row] = values.get(name, np.nan if name != "entry" else -1)
+        self._size += 1
+        self.total += 1
+        return row
+
+    def record_buy(self, price, coins, timestamp, fee, investment):
+        """Append a buy and mark it open; returns its row"""
+        row = self._append(
+            side=1,
+            price=price,
+            coins=coins,
+            timestamp=timestamp,
+            fee=fee,
+            investment=investment,
+        )
+        self._open.append(row)
+        return row
+
+    def open_position(self):
+        """Row of the most recent open buy, or None"""
+        return self._open[-1] if self._open else None
+
+    def record_sell(
+        self,
+        price,
+        coins,
+        timestamp,
+        fee,
+        gross_proceeds,
+        net_proceeds,
+        profit_loss,
+        tax=0.0,
+    ):
+        """Append a sell closing the most recent open buy; returns its row"""
+        entry = self._open.pop()
+        return self._append(
+            side=-1,
+            price=price,
+            coins=coins,
+            timestamp=timestamp,
+            fee=fee,
+            gross_proceeds=gross_proceeds,
+            net_proceeds=net_proceeds,
+            profit_loss=profit_loss,
+            tax=tax,
+            entry=entry,
+        )
+
+    def value(self, name, row):
+        """Single cell as a Python scalar"""
+        return self._columns[name][row].item()
+
+    def trade(self, row):
+        """One trade as a dict"""
+        columns = self._columns
+        side = int(columns["side"][row])
+        trade = {
+            "type": TRADE_TYPES[side],
+            "price": columns["price"][row].item(),
+            "coins": columns["coins"][row].item(),
+            "timestamp": columns["timestamp"][row].item(),
+            "fee": columns["fee"][row].item(),
+        }
+        if side == 1:
+            trade["investment"] = columns["investment"][row].item()
+        else:
+            trade["gross_proceeds"] = columns["gross_proceeds"][row].item()
+            trade["net_proceeds"] = columns["net_proceeds"][row].item()
+            trade["profit_loss"] = columns["profit_loss"][row].item()
+            trade["tax"] = columns["tax"][row].item()
+        return trade
+
+    def _format(self, row):
+        trade = self.trade(row)
+        formatted = {
+            "timestamp": trade["timestamp"],
+            "type": trade["type"],
+            "price": round(trade["price"], 2),
+            "coins": round(trade["coins"], 8),
+            "fee": round(trade["fee"], 2),
+        }
+        if trade["type"] == "sell":
+            formatted["profit_loss"] = round(trade["profit_loss"], 2)
+            formatted["net_proceeds"] = round(trade["net_proceeds"], 2)
+            formatted["tax"] = round(trade["tax"], 2)
+        return formatted
+
+    def history(self, offset=0, limit=None):
+        """
+        Page of formatted trades, newest first.
+
+        Args:
+            offset: Number of newest trades to skip
+            limit: Maximum number of trades to return (all when None)
+
+        Returns:
+            List of rounded trade dicts; rows are cached and shared between
+            calls, so treat them as read-only
+        """
+        stop = self._size - offset
+        start = 0 if limit is None else max(0, stop - limit)
+        page = []
+        for row in range(stop - 1, start - 1, -1):
+            if row >= len(self._formatted):
+                self._formatted.extend([None] * (row + 1 - len(self._formatted)))
+            formatted = self._formatted[row]
+            if formatted is None:
+                formatted = self._formatted[row] = self._format(row)
+            page.append(formatted)
+        return page
+
+    def clear(self):
+        """Forget all trades, keeping the allocated arrays"""
+        self._size = 0
+        self._open = []
+        self._formatted = []
@@ -1,37 +1,141 @@
 import dash
 from dash import html, dcc
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
 import plotly.graph_objs as go
-from collections import deque
+import hashlib
 import json
 import threading
 import time
 import numpy as np
 from datetime import datetime
 from src.Strategies.moving_average import MovingAverageStrategy
-from src.Data_feed.DataStream import EnhancedCryptoStream
+from src.Strategies.engine import StrategyEngine
+from src.Data_feed.async_stream import AsyncCryptoStream
+from src.app.push import PushPublisher
+from src.app.downsample import Downsampler, bucket_size_for
+from dash_socketio import DashSocketIO
 import os
 
 
+# Clientside callback for the push transport: drops points the client has
+# already drawn (sequence numbers), extends the traces and swaps in the
+# server-rendered panels. Until a full update arrives, deltas are ignored.
+APPLY_PUSH_UPDATE = """
+function (update, chartState, figure) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (!update || (chartState == null && !update.reset)) {
+        return [noUpdate, noUpdate, noUpdate, noUpdate, noUpdate, noUpdate];
+    }
+    var extend = noUpdate, redraw = noUpdate, state = noUpdate;
+    var chart = update.chart;
+    if (chart && update.reset) {
+        var xs = chart.x.concat(chart.tail_x), ys = chart.y.concat(chart.tail_y);
+        redraw = Object.assign({}, figure, {
+            data: figure.data.map(function (trace, i) {
+                return Object.assign({}, trace, {x: xs[i], y: ys[i]});
+            })
+        });
+        state = update.chart_state;
+    } else if (chart && chartState[1] === update.chart_state[1]) {
+        // Settled points the client lacks are appended; each live tail
+        // replaces the previous one (maxPoints = its own length)
+        var data = {x: [], y: []}, traces = [], maxPoints = {x: [], y: []};
+        var add = function (trace, x, y, max) {
+            data.x.push(x);
+            data.y.push(y);
+            traces.push(trace);
+            maxPoints.x.push(max);
+            maxPoints.y.push(max);
+        };
+        for (var i = 0; i < 3; i++) {
+            var seq = chart.seq[i], skip = 0;
+            while (skip < seq.length && seq[skip] <= chartState[0]) {
+                skip++;
+            }
+            if (skip < seq.length) {
+                add(i, chart.x[i].slice(skip), chart.y[i].slice(skip), update.max_points);
+            }
+        }
+        for (i = 0; i < 3; i++) {
+            if (chart.tail_x[i].length) {
+                add(i + 3, chart.tail_x[i], chart.tail_y[i], chart.tail_x[i].length);
+            }
+        }
+        if (traces.length) {
+            extend = [data, traces, maxPoints];
+        }
+        state = [Math.max(chartState[0], update.chart_state[0]), chartState[1]];
+    }
+    var panels = (update.panels || [null, null, null]).map(function (panel) {
+        return panel == null ? noUpdate : panel;
+    });
+    return [extend, redraw, state, panels[0], panels[1], panels[2]];
+}
+"""
+
+
 class CryptoPriceDashboard2:
     def __init__(
-        self, symbol="BTC-USD", short_window=10, long_window=50, investment_amount=1000
+        self,
+        symbol="BTC-USD",
+        short_window=10,
+        long_window=50,
+        investment_amount=1000,
+        feed_url=None,
+        incremental_chart=True,
+        transport="push",
+        push_rate=4,
+        history_size=None,
+        chart_points=1000,
     ):
         # Initialize price and time tracking (these will now be managed by EnhancedCryptoStream)
         self.investment_amount = investment_amount
 
         # Initialize strategy
-        self.strategy = MovingAverageStrategy(short_window, long_window)
-        self.short_ma = deque(maxlen=200)
-        self.long_ma = deque(maxlen=200)
-        self.signals = deque(maxlen=200)
+        self.strategy = MovingAverageStrategy(short_window, long_window, symbol=symbol)
 
-        # Initialize the enhanced crypto stream
-        self.crypto_stream = EnhancedCryptoStream(symbol=symbol)
+        # Initialize the crypto stream; reconnects, heartbeat and memory
+        # checks run as tasks on the stream's own event loop
+        self.crypto_stream = AsyncCryptoStream(
+            symbol=symbol, feed_url=feed_url, history_size=history_size
+        )
+
+        # The engine trades on every aggregated price as the stream produces
+        # it; the dashboard callbacks only read its published results
+        self.engine = StrategyEngine(self.crypto_stream)
+        self.strategy_name = self.engine.add_strategy(
+            self.strategy,
+            name=symbol,
+            symbols=[symbol],
+            investment_amount=investment_amount,
+        )
 
         # Store symbol for reference
         self.symbol = symbol
 
+        # Last (key, component) rendered for the signal, metrics and trades
+        # panels; a panel is only rebuilt when its key changes
+        self._panel_cache = [None, None, None]
+
+        # Each chart trace is downsampled to at most chart_points points, so
+        # long histories cost the browser no more than short ones. The
+        # bucket size is shared by the traces and never shrinks.
+        self.chart_points = chart_points
+        self._downsamplers = [Downsampler(chart_points) for _ in range(3)]
+        self._bucket_size = 1
+        self._chart_lock = threading.Lock()
+
+        # "push" sends coalesced updates over Socket.IO at most push_rate
+        # times per second; "poll" refreshes on a 1 s dcc.Interval instead
+        if transport not in ("push", "poll"):
+            raise ValueError("transport must be 'push' or 'poll'")
+        self.transport = transport
+
+        # Incremental mode ships only new points via extendData; otherwise
+        # the whole figure is rebuilt on every refresh (poll transport only)
+        incremental_chart = incremental_chart or transport == "push"
+        self.incremental_chart = incremental_chart
+
         # Dash app setup with proper asset serving
         self.app = dash.Dash(
             __name__,
@@ -78,10 +182,18 @@ class CryptoPriceDashboard2:
                 # Main Chart - Moved here, right after header
                 html.Div(
                     dcc.Graph(
-                        id="live-graph", animate=True, className="chart-container"
+                        id="live-graph",
+                        animate=not incremental_chart,
+                        className="chart-container",
+                        **({"figure": self._initial_figure()} if incremental_chart else {}),
                     ),
                     className="bg-dark rounded-lg shadow-lg p-4 mb-4",
                 ),
+                # [newest settled sequence number, bucket size] this client
+                # has drawn
+                dcc.Store(id="chart-seq", data=None),
+                # Render keys of the panels this client currently shows
+                dcc.Store(id="panel-keys", data=None),
                 # Account Metrics Section
                 html.Div(
                     id="account-metrics",
@@ -118,20 +230,65 @@ class CryptoPriceDashboard2:
                     ],
                     className="grid grid-cols-1 gap-4",
                 ),
-                dcc.Interval(id="graph-update", interval=1000, n_intervals=0),
+                (
+                    DashSocketIO(id="socketio", eventNames=["price_update"])
+                    if transport == "push"
+                    else dcc.Interval(id="graph-update", interval=1000, n_intervals=0)
+                ),
             ],
             className="min-h-screen bg-dark",
         )
         # Callbacks
-        self.app.callback(
-            [
-                Output("live-graph", "figure"),
-                Output("signal-output", "children"),
-                Output("account-metrics", "children"),
-                Output("trade-history", "children"),
-            ],
-            [Input("graph-update", "n_intervals")],
-        )(self.update_graph_and_signal)
+        if transport == "push":
+            # Applied in the browser: no server callback runs per client
+            self.app.clientside_callback(
+                APPLY_PUSH_UPDATE,
+                [
+                    Output("live-graph", "extendData"),
+                    Output("live-graph", "figure"),
+                    Output("chart-seq", "data"),
+                    Output("signal-output", "children"),
+                    Output("account-metrics", "children"),
+                    Output("trade-history", "children"),
+                ],
+                [Input("socketio", "data-price_update")],
+                [State("chart-seq", "data"), State("live-graph", "figure")],
+            )
+            self.publisher = PushPublisher(
+                self.app, self.build_push_update, max_rate=push_rate
+            )
+        elif incremental_chart:
+            self.app.callback(
+                [
+                    Output("live-graph", "extendData"),
+                    Output("live-graph", "figure"),
+                    Output("chart-seq", "data"),
+                ],
+                [Input("graph-update", "n_intervals")],
+                [State("chart-seq", "data")],
+            )(self.extend_chart)
+            self.app.callback(
+                [
+                    Output("signal-output", "children"),
+                    Output("account-metrics", "children"),
+                    Output("trade-history", "children"),
+                    Output("panel-keys", "data"),
+                ],
+                [Input("graph-update", "n_intervals")],
+                [State("panel-keys", "data")],
+            )(self.update_panels)
+        else:
+            self.app.callback(
+                [
+                    Output("live-graph", "figure"),
+                    Output("signal-output", "children"),
+                    Output("account-metrics", "children"),
+                    Output("trade-history", "children"),
+                    Output("panel-keys", "data"),
+                ],
+                [Input("graph-update", "n_intervals")],
+                [State("panel-keys", "data")],
+            )(self.update_graph_and_signal)
 
         # WebSocket connection details
         self.symbol = symbol
@@ -353,168 +510,358 @@ class CryptoPriceDashboard2:
             className="min-w-full table-auto bg-gray-800 rounded-lg overflow-hidden",  # Enhanced table styling
         )
 
-    def calculate_moving_averages(self):
-        """Calculate moving averages using data from EnhancedCryptoStream"""
-        # Get prices from the crypto stream
-        prices_list = list(self.crypto_stream.prices)
-
-        if len(prices_list) >= self.strategy.long_window:
-            try:
-                # Calculate short MA with numpy for efficiency
-                short_window_vals = prices_list[-self.strategy.short_window :]
-                short_ma_value = np.mean(short_window_vals)
-                self.short_ma.append(short_ma_value)
-
-                # Calculate long MA with numpy for efficiency
-                long_window_vals = prices_list[-self.strategy.long_window :]
-                long_ma_value = np.mean(long_window_vals)
-                self.long_ma.append(long_ma_value)
-
-                # Get trading signal
-                signal = self.strategy.calculate_signals(prices_list)
-                self.signals.append(signal)
-                return signal
-
-            except Exception as e:
-                print(f"Error calculating moving averages: {str(e)}")
-                return None
-        return None
-
-    def update_graph_and_signal(self, n):
-        """Update the dashboard with latest data from EnhancedCryptoStream"""
-        try:
-            # Get current price and time from crypto stream
-            current_price = (
-                self.crypto_stream.prices[-1]
-                if len(self.crypto_stream.prices) > 0
-                else 0
-            )
-            current_time = (
-                self.crypto_stream.price_times[-1]
-                if len(self.crypto_stream.price_times) > 0
-                else int(time.time() * 1000)
+    def _panel_keys(self, result):
+        """Render keys of the signal, metrics and trades panels"""
+        metrics = result["metrics"]
+        return [
+            f"{result['signal']}|{metrics['position']}",
+            hashlib.md5(repr(sorted(metrics.items())).encode()).hexdigest(),
+            f"trades-{result['trade_seq']}",
+        ]
+
+    def _render_panel(self, index, key, build):
+        """Return the cached panel component for key, building it if needed"""
+        cached = self._panel_cache[index]
+        if cached is None or cached[0] != key:
+            cached = self._panel_cache[index] = (key, build())
+        return cached[1]
+
+    def _panels(self, rendered_keys=None, unchanged=dash.no_update):
+        """
+        Signal, metric cards and trade table from the engine's result.
+
+        Args:
+            rendered_keys: Panel keys the client already shows
+            unchanged: Returned in place of panels the client already has
+
+        Returns:
+            (panels, keys): the three panel components and their keys
+        """
+        # Signal, metrics and trade history as last published by the
+        # engine; rendering never evaluates or trades
+        result = self.engine.result(self.strategy_name)
+        metrics = result["metrics"]
+        keys = self._panel_keys(result)
+        builders = (
+            lambda: self._generate_signal_text(result["signal"], metrics),
+            lambda: self.create_metrics_cards(metrics),
+            lambda: self.create_trade_history_table(result["trade_history"]),
+        )
+        rendered_keys = rendered_keys or [None, None, None]
+        panels = tuple(
+            (
+                unchanged
+                if rendered_keys[i] == keys[i]
+                else self._render_panel(i, keys[i], builders[i])
             )
+            for i in range(3)
+        )
+        return panels, keys
 
-            # Calculate MAs and get signal
-            current_signal = self.calculate_moving_averages()
-
-            # Execute trade if we have a valid signal
-            if current_signal and current_price > 0:
-                self.strategy.execute_trade(
-                    current_signal, current_price, current_time, self.investment_amount
-                )
+    def update_panels(self, n, rendered_keys=None):
+        """Refresh everything except the chart (incremental chart mode)"""
+        try:
+            panels, keys = self._panels(rendered_keys)
+            if all(panel is dash.no_update for panel in panels):
+                keys = dash.no_update
+            return panels + (keys,)
+        except Exception as e:
+            print(f"Error updating dashboard: {str(e)}")
+            return self._generate_empty_dashboard()[1:] + (None,)
+
+    def _chart_layout(self, x_range=None, y_range=None):
+        """Chart layout; axes autorange unless explicit ranges are given"""
+        return go.Layout(
+            title=f"{self.symbol} Real-Time Price with Moving Averages",
+            paper_bgcolor="#1c2537",
+            plot_bgcolor="#1c2537",
+            font=dict(color="#e2e8f0"),
+            xaxis=dict(
+                range=x_range,
+                autorange=x_range is None,
+                gridcolor="#2d3748",
+                zerolinecolor="#2d3748",
+                type="date",  # Specify x-axis type as date
+                tickformat="%H:%M:%S",  # Format as Hours:Minutes:Seconds
+                tickmode="auto",  # Automatic tick mode
+                nticks=10,  # Number of ticks to display
+                tickfont=dict(size=10),  # Tick font size
+            ),
+            yaxis=dict(
+                range=y_range,
+                autorange=y_range is None,
+                gridcolor="#2d3748",
+                zerolinecolor="#2d3748",
+            ),
+        )
 
-            # Get performance metrics and trade history
-            metrics = self.strategy.get_performance_metrics()
-            trade_history = self.strategy.get_trade_history()
+    def _chart_traces(self, xs, ys):
+        """
+        Price, short MA and long MA traces, in extendData trace order.
+
+        With six series, traces 3-5 are the live tails of traces 0-2: the
+        downsampled points of their still open bucket, which are replaced
+        rather than extended on every update.
+        """
+        styles = [
+            dict(
+                name="Price",
+                mode="lines+markers",
+                line=dict(color="#3b82f6"),
+                marker=dict(size=4),
+            ),
+            dict(
+                name=f"{self.strategy.short_window}MA",
+                mode="lines",
+                line=dict(color="#f59e0b"),
+            ),
+            dict(
+                name=f"{self.strategy.long_window}MA",
+                mode="lines",
+                line=dict(color="#ef4444"),
+            ),
+        ]
+        return [
+            go.Scatter(
+                x=x,
+                y=y,
+                legendgroup=styles[i % 3]["name"],
+                showlegend=i < 3,
+                **styles[i % 3],
+            )
+            for i, (x, y) in enumerate(zip(xs, ys))
+        ]
+
+    def _initial_figure(self):
+        """Empty chart that the incremental updates fill in"""
+        return {
+            "data": self._chart_traces([[]] * 6, [[]] * 6),
+            "layout": self._chart_layout(),
+        }
 
-            # NEW CODE:
-            formatted_times = [
-                datetime.fromtimestamp(t / 1000) for t in self.crypto_stream.price_times
-            ]
-            traces = [
-                go.Scatter(
-                    x=formatted_times,  # Using formatted datetime objects
-                    y=list(self.crypto_stream.prices),
-                    name="Price",
-                    mode="lines+markers",
-                    line=dict(color="#3b82f6"),
-                    marker=dict(size=4),
+    def _chart_series(self, snapshot):
+        """
+        Downsampled price/short MA/long MA series of one snapshot.
+
+        Returns:
+            (bucket_size, series): per trace, (values, first_seq, settled,
+            pending), where values[i] has sequence number first_seq + i and
+            settled/pending are as returned by Downsampler.update
+        """
+        short_window = self.strategy.short_window
+        long_window = self.strategy.long_window
+        trace_values = (
+            (snapshot.prices, snapshot.first_seq),
+            (snapshot.rolling_mean(short_window), snapshot.first_seq + short_window - 1),
+            (snapshot.rolling_mean(long_window), snapshot.first_seq + long_window - 1),
+        )
+        with self._chart_lock:
+            self._bucket_size = max(
+                self._bucket_size, bucket_size_for(len(snapshot), self.chart_points)
+            )
+            series = [
+                (values, first_seq)
+                + downsampler.update(first_seq, values, self._bucket_size)
+                for downsampler, (values, first_seq) in zip(
+                    self._downsamplers, trace_values
                 )
             ]
+            return self._bucket_size, series
+
+    def _points(self, snapshot, values, first_seq, seqs):
+        """x (ISO strings) and y lists of the points with sequence numbers seqs"""
+        times = snapshot.local_times()[seqs - snapshot.first_seq]
+        return (
+            np.datetime_as_string(times, unit="ms").tolist(),
+            values[seqs - first_seq].tolist(),
+        )
 
-            # For Short MA
-            if len(self.short_ma) > 0:
-                # Calculate correct x-axis values for MAs
-                ma_times = list(self.crypto_stream.price_times)[-len(self.short_ma) :]
-                formatted_ma_times = [
-                    datetime.fromtimestamp(t / 1000) for t in ma_times
-                ]
-                traces.append(
-                    go.Scatter(
-                        x=formatted_ma_times,  # Using formatted datetime objects
-                        y=list(self.short_ma),
-                        name=f"{self.strategy.short_window}MA",
-                        mode="lines",
-                        line=dict(color="#f59e0b"),
-                    )
-                )
+    def _chart_points(self, snapshot, chart_state=None):
+        """
+        Downsampled chart points a client showing `chart_state` lacks.
+
+        Args:
+            chart_state: [newest settled sequence number, bucket size, ...]
+                the client has drawn, or None
+
+        Returns:
+            Dict with "reset" (the client must redraw from scratch), the
+            settled points newer than the client's per trace ("x", "y",
+            "seq"), each trace's live tail ("tail_x", "tail_y") starting at
+            its last settled point, and the client's new "chart_state"
+        """
+        bucket_size, series = self._chart_series(snapshot)
+        reset = chart_state is None or chart_state[1] != bucket_size
+        # Every trace's settled buckets end at the same sequence number
+        settled_seq = (snapshot.total + 1) // bucket_size * bucket_size - 1
+        points = {
+            "reset": reset,
+            "chart_state": [settled_seq, bucket_size],
+            "x": [],
+            "y": [],
+            "seq": [],
+            "tail_x": [],
+            "tail_y": [],
+        }
+        for values, first_seq, settled, pending in series:
+            new = settled
+            if not reset:
+                new = settled[np.searchsorted(settled, chart_state[0], side="right") :]
+            x, y = self._points(snapshot, values, first_seq, new)
+            points["x"].append(x)
+            points["y"].append(y)
+            points["seq"].append(new.tolist())
+            # Starting the tail at the last settled point keeps the line joined
+            tail_x, tail_y = self._points(
+                snapshot, values, first_seq, np.concatenate((settled[-1:], pending))
+            )
+            points["tail_x"].append(tail_x)
+            points["tail_y"].append(tail_y)
+        return points
+
+    def extend_chart(self, n, chart_state):
+        """
+        Send only the downsampled points the client has not drawn yet.
+
+        Returns:
+            (extendData appending settled points and replacing the live
+            tails, a redrawn figure instead when the client has to reset,
+            the client's new chart state)
+        """
+        try:
+            snapshot = self.crypto_stream.snapshot()
+            # Polling clients also record the newest sequence number seen,
+            # so a poll without new prices sends nothing
+            if chart_state and chart_state[2:] == [snapshot.total]:
+                return dash.no_update, dash.no_update, dash.no_update
+            points = self._chart_points(snapshot, chart_state)
+            new_state = points["chart_state"] + [snapshot.total]
+            if points["reset"]:
+                figure = {
+                    "data": self._chart_traces(
+                        points["x"] + points["tail_x"], points["y"] + points["tail_y"]
+                    ),
+                    "layout": self._chart_layout(),
+                }
+                return dash.no_update, figure, new_state
+
+            data, traces, max_points = {"x": [], "y": []}, [], []
+            for i in range(3):
+                if points["x"][i]:
+                    data["x"].append(points["x"][i])
+                    data["y"].append(points["y"][i])
+                    traces.append(i)
+                    max_points.append(self.chart_points)
+            for i in range(3):
+                if points["tail_x"][i]:
+                    data["x"].append(points["tail_x"][i])
+                    data["y"].append(points["tail_y"][i])
+                    traces.append(i + 3)
+                    max_points.append(len(points["tail_x"][i]))
+            if not traces:
+                return dash.no_update, dash.no_update, new_state
+            return (
+                (data, traces, {"x": max_points, "y": max_points}),
+                dash.no_update,
+                new_state,
+            )
+        except Exception as e:
+            print(f"Error extending chart: {str(e)}")
+            return dash.no_update, dash.no_update, dash.no_update
+
+    def build_push_update(self, state):
+        """
+        Coalesce everything that changed since `state` into one push payload.
+
+        Args:
+            state: (last sequence number, chart state, engine result and
+                panel keys sent), or None for a full update
+
+        Returns:
+            (payload or None when nothing changed, new state)
+        """
+        full = state is None
+        last_seq, chart_state, last_result, last_keys = state or (None,) * 4
+        snapshot = self.crypto_stream.snapshot()
+        result = self.engine.result(self.strategy_name)
+        payload = {"full": full, "reset": full}
+
+        if full or snapshot.total != last_seq:
+            points = self._chart_points(snapshot, None if full else chart_state)
+            chart_state = points.pop("chart_state")
+            payload["reset"] = points.pop("reset")
+            payload["chart"] = points
+            payload["chart_state"] = chart_state
+            payload["max_points"] = self.chart_points
+            payload["price"] = snapshot.last_price
+
+        if result is not last_result:
+            metrics = result["metrics"]
+            previous = last_result["metrics"] if last_result and not full else {}
+            payload["signal"] = result["signal"]
+            payload["metrics"] = {
+                key: value
+                for key, value in metrics.items()
+                if key not in previous or previous[key] != value
+            }
+            panels, last_keys = self._panels(last_keys, unchanged=None)
+            if any(panel is not None for panel in panels):
+                payload["panels"] = panels
 
-            # For Long MA
-            if len(self.long_ma) > 0:
-                ma_times = list(self.crypto_stream.price_times)[-len(self.long_ma) :]
-                formatted_ma_times = [
-                    datetime.fromtimestamp(t / 1000) for t in ma_times
-                ]
-                traces.append(
-                    go.Scatter(
-                        x=formatted_ma_times,  # Using formatted datetime objects
-                        y=list(self.long_ma),
-                        name=f"{self.strategy.long_window}MA",
-                        mode="lines",
-                        line=dict(color="#ef4444"),
-                    )
-                )
+        if not full and len(payload) == 2:
+            return None, state
+        return payload, (snapshot.total, chart_state, result, last_keys)
 
-            layout = go.Layout(
-                title=f"{self.symbol} Real-Time Price with Moving Averages",
-                paper_bgcolor="#1c2537",
-                plot_bgcolor="#1c2537",
-                font=dict(color="#e2e8f0"),
-                xaxis=dict(
-                    range=[
-                        min(formatted_times) if formatted_times else 0,
-                        max(formatted_times) if formatted_times else 0,
-                    ],
-                    gridcolor="#2d3748",
-                    zerolinecolor="#2d3748",
-                    type="date",  # Specify x-axis type as date
-                    tickformat="%H:%M:%S",  # Format as Hours:Minutes:Seconds
-                    tickmode="auto",  # Automatic tick mode
-                    nticks=10,  # Number of ticks to display
-                    tickfont=dict(size=10),  # Tick font size
+    def update_graph_and_signal(self, n, rendered_keys=None):
+        """Update the dashboard with latest data from the crypto stream"""
+        try:
+            # Prices, times and MAs below all come from this one snapshot
+            snapshot = self.crypto_stream.snapshot()
+            _, series = self._chart_series(snapshot)
+            xs, ys = [], []
+            for values, first_seq, settled, pending in series:
+                x, y = self._points(
+                    snapshot, values, first_seq, np.concatenate((settled, pending))
+                )
+                xs.append(x)
+                ys.append(y)
+            traces = self._chart_traces(xs, ys)
+
+            # Downsampling keeps every bucket's min and max, so the ranges
+            # are the same as over the full series
+            formatted_times = snapshot.local_times()
+            layout = self._chart_layout(
+                x_range=(
+                    np.datetime_as_string(formatted_times[[0, -1]], unit="ms").tolist()
+                    if len(formatted_times)
+                    else [0, 0]
                 ),
-                yaxis=dict(
-                    range=self._calculate_y_axis_range(),
-                    gridcolor="#2d3748",
-                    zerolinecolor="#2d3748",
+                y_range=self._calculate_y_axis_range(
+                    snapshot.prices,
+                    snapshot.rolling_mean(self.strategy.short_window),
+                    snapshot.rolling_mean(self.strategy.long_window),
                 ),
             )
 
-            # Generate signal components
-            signal_text = self._generate_signal_text(current_signal, metrics)
-            metric_cards = self.create_metrics_cards(metrics)
-            trade_table = self.create_trade_history_table(trade_history)
-
-            return (
-                {"data": traces, "layout": layout},
-                signal_text,
-                metric_cards,
-                trade_table,
-            )
+            panels, keys = self._panels(rendered_keys)
+            return ({"data": traces, "layout": layout},) + panels + (keys,)
 
         except Exception as e:
             print(f"Error updating dashboard: {str(e)}")
             # Return empty/default values in case of error
-            return self._generate_empty_dashboard()
+            return self._generate_empty_dashboard() + (None,)
 
-    def _calculate_y_axis_range(self):
+    def _calculate_y_axis_range(self, prices, *series):
         """Calculate dynamic y-axis range for the graph"""
         try:
-            min_price = (
-                min(self.crypto_stream.prices) if self.crypto_stream.prices else 0
-            )
-            max_price = (
-                max(self.crypto_stream.prices) if self.crypto_stream.prices else 0
-            )
+            min_price = float(prices.min()) if len(prices) else 0
+            max_price = float(prices.max()) if len(prices) else 0
 
             # Include MA values in range calculation
-            if self.short_ma:
-                min_price = min(min_price, min(self.short_ma))
-                max_price = max(max_price, max(self.short_ma))
-            if self.long_ma:
-                min_price = min(min_price, min(self.long_ma))
-                max_price = max(max_price, max(self.long_ma))
+            for values in series:
+                if len(values):
+                    min_price = min(min_price, float(values.min()))
+                    max_price = max(max_price, float(values.max()))
 
             # Add padding
             padding = (max_price - min_price) * 0.05
@@ -579,6 +926,8 @@ class CryptoPriceDashboard2:
         try:
             if hasattr(self, "crypto_stream"):
                 print("Stopping crypto stream...")
+                if self.transport == "push":
+                    self.publisher.stop()
                 self.crypto_stream.stop()
 
                 # Wait for websocket thread to finish
@@ -595,14 +944,15 @@ class CryptoPriceDashboard2:
 
     def _save_final_state(self):
         """Save the final state before shutdown"""
-        if not self.crypto_stream.prices:
+        snapshot = self.crypto_stream.snapshot()
+        if not len(snapshot):
             return
 
         try:
             final_state = {
                 "timestamp": time.time(),
-                "last_price": self.crypto_stream.prices[-1],
-                "metrics": self.strategy.get_performance_metrics(),
+                "last_price": snapshot.last_price,
+                "metrics": self.engine.result(self.strategy_name)["metrics"],
                 "trade_history": self.strategy.get_trade_history(),
             }
 
@@ -613,9 +963,9 @@ class CryptoPriceDashboard2:
             print(f"Error saving final state: {str(e)}")
 
     def start_websocket(self):
-        """Start the websocket connection using EnhancedCryptoStream"""
+        """Start the websocket connection using AsyncCryptoStream"""
         try:
-            # Create a thread for the crypto stream
+            # Create a thread for the stream's event loop
             self.websocket_thread = threading.Thread(
                 target=self.crypto_stream.start_websocket
             )
@@ -641,24 +991,14 @@ class CryptoPriceDashboard2:
         try:
             # Start the websocket connection
             self.start_websocket()
+            if self.transport == "push":
+                self.publisher.start()
 
             # Register shutdown handler
             import atexit
 
             atexit.register(self.stop_stream)
 
-            # Monitor stream health in a separate thread
-            def monitor_stream():
-                while True:
-                    if not self.crypto_stream.connected.is_set():
-                        print("Stream connection lost, attempting to reconnect...")
-                        self.start_websocket()
-                    time.sleep(30)  # Check every 30 seconds
-
-            monitor_thread = threading.Thread(target=monitor_stream)
-            monitor_thread.daemon = True
-            monitor_thread.start()
-
             # Run the Dash server
             port = int(os.environ.get("PORT", 8050))
             self.app.run_server(
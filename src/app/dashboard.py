@@ -274,7 +274,7 @@ class CryptoPriceDashboard:
 
         # Get performance metrics and trade history
         metrics = self.strategy.get_performance_metrics()
-        trade_history = self.strategy.get_trade_history()
+        trade_history = self.strategy.get_trade_history(limit=5)
 
         traces = []
 
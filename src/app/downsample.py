@@ -0,0 +1,118 @@
+import numpy as np
+
+
+def bucket_size_for(count, budget):
+    """
+    Bucket size that fits `count` points into `budget` chart points.
+
+    Every bucket keeps at most two points and partly filled buckets may sit
+    at both ends, so ceil(count / size) + 1 buckets have to fit. Sizes are
+    powers of two, so a growing history changes the size only when it
+    doubles.
+    """
+    if count <= budget:
+        return 1
+    size = 2
+    while 2 * (-(-count // size) + 1) > budget:
+        size *= 2
+    return size
+
+
+def minmax_indices(values, bucket_size):
+    """
+    Positions of the min and max of each full bucket, in time order.
+
+    A bucket whose min and max are the same point contributes it once.
+    """
+    count = len(values) // bucket_size
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+    if bucket_size == 1:
+        return np.arange(count, dtype=np.int64)
+    rows = np.asarray(values[: count * bucket_size]).reshape(count, bucket_size)
+    low = rows.argmin(axis=1)
+    high = rows.argmax(axis=1)
+    offsets = np.arange(count, dtype=np.int64)[:, None] * bucket_size
+    pairs = np.column_stack((np.minimum(low, high), np.maximum(low, high))) + offsets
+    keep = np.ones(pairs.shape, dtype=bool)
+    keep[:, 1] = low != high
+    return pairs[keep]
+
+
+class Downsampler:
+    """Min/max-per-bucket downsampling of one growing series.
+
+    Buckets are aligned to sequence numbers (bucket k holds sequence
+    numbers k * size to (k + 1) * size - 1), so a full bucket's min and max
+    never change. They are reduced once and cached; an update only reduces
+    the buckets completed since the previous one, plus the partly evicted
+    first bucket and the open last bucket. Keeping each bucket's extremes,
+    rather than an average or every n-th point, keeps spikes visible.
+    """
+
+    def __init__(self, budget=1000):
+        """
+        Args:
+            budget: Target number of points returned per update
+        """
+        if budget < 4:
+            raise ValueError("budget must be at least 4 points")
+        self.budget = budget
+        self.bucket_size = None
+        self._seqs = np.empty(0, dtype=np.int64)  # Picked from full buckets
+        self._end = None  # Sequence number where the cached buckets end
+
+    def _reduce(self, values, first_seq, start, end):
+        """Min/max of values with sequence numbers [start, end) as one bucket"""
+        if end <= start:
+            return np.empty(0, dtype=np.int64)
+        offset = start - first_seq
+        return minmax_indices(values[offset : offset + end - start], end - start) + start
+
+    def update(self, first_seq, values, bucket_size=None):
+        """
+        Downsample a series whose values[i] has sequence number first_seq + i.
+
+        Args:
+            bucket_size: Points per bucket (defaults to the smallest size
+                that fits the budget); changing it drops the cache
+
+        Returns:
+            (settled, pending): sequence numbers of the points kept, in
+            order. Settled points come from buckets that take no more
+            points; pending ones from the open last bucket, which is
+            reduced again on every update.
+        """
+        count = len(values)
+        if bucket_size is None:
+            bucket_size = bucket_size_for(count, self.budget)
+        if bucket_size != self.bucket_size:
+            self.bucket_size = bucket_size
+            self._end = None
+        if count == 0:
+            return self._seqs[:0], self._seqs[:0]
+
+        end_seq = first_seq + count
+        full_start = -(-first_seq // bucket_size) * bucket_size
+        full_end = end_seq // bucket_size * bucket_size
+        if full_start > full_end:
+            # Everything falls into the open bucket
+            return self._seqs[:0], self._reduce(values, first_seq, first_seq, end_seq)
+
+        if self._end is None or not full_start <= self._end <= full_end:
+            self._seqs = np.empty(0, dtype=np.int64)
+            self._end = full_start
+        else:
+            # Forget buckets evicted from the front of the history
+            self._seqs = self._seqs[np.searchsorted(self._seqs, full_start) :]
+        if full_end > self._end:
+            offset = self._end - first_seq
+            completed = minmax_indices(
+                values[offset : full_end - first_seq], bucket_size
+            )
+            self._seqs = np.concatenate((self._seqs, completed + self._end))
+            self._end = full_end
+
+        head = self._reduce(values, first_seq, first_seq, full_start)
+        settled = np.concatenate((head, self._seqs)) if len(head) else self._seqs
+        return settled, self._reduce(values, first_seq, full_end, end_seq)
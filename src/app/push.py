@@ -0,0 +1,77 @@
+import json
+import logging
+import threading
+import time
+
+import plotly
+import socketio
+
+logger = logging.getLogger(__name__)
+
+
+def to_json_data(value):
+    """Convert Dash components / NumPy values into plain JSON data"""
+    return json.loads(json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+class PushPublisher:
+    """Pushes coalesced updates to Socket.IO clients at a bounded rate.
+
+    A background task wakes max_rate times per second and asks
+    build_update(state) for everything that changed since the previous
+    push; a non-empty result is broadcast once to all clients. However
+    fast the feed ticks, each client receives at most max_rate messages per
+    second and no server work happens per client. Newly connected clients
+    receive a full update (build_update(None)) of their own.
+    """
+
+    def __init__(self, app, build_update, event="price_update", max_rate=4):
+        """
+        Args:
+            app: Dash app whose Flask server gets the Socket.IO endpoint
+            build_update: Callable(state) -> (payload or None, new state);
+                state None asks for a full update
+            event: Socket.IO event name the clients listen to
+            max_rate: Maximum pushes per second
+        """
+        self.build_update = build_update
+        self.event = event
+        self.max_rate = max_rate
+        self.sio = socketio.Server(async_mode="threading", cors_allowed_origins="*")
+        app.server.wsgi_app = socketio.WSGIApp(self.sio, app.server.wsgi_app)
+        self.sio.on("connect", self._on_connect)
+
+        self._state = None
+        self._running = threading.Event()
+        self.pushes = 0
+        self.last_push_time = None
+
+    def _on_connect(self, sid, environ, auth=None):
+        payload, _ = self.build_update(None)
+        if payload is not None:
+            self.sio.emit(self.event, to_json_data(payload), to=sid)
+
+    def start(self):
+        """Start the background push task (no-op if already running)"""
+        if not self._running.is_set():
+            self._running.set()
+            self.sio.start_background_task(self._run)
+
+    def stop(self):
+        """Stop pushing after the current cycle; clients stay connected"""
+        self._running.clear()
+
+    def _run(self):
+        interval = 1.0 / self.max_rate
+        next_push = time.monotonic()
+        while self._running.is_set():
+            next_push += interval
+            time.sleep(max(0.0, next_push - time.monotonic()))
+            try:
+                payload, self._state = self.build_update(self._state)
+                if payload is not None:
+                    self.sio.emit(self.event, to_json_data(payload))
+                    self.pushes += 1
+                    self.last_push_time = time.time()
+            except Exception as e:
+                logger.error(f"Error pushing update: {str(e)}")
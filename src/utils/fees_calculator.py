@@ -1,10 +1,131 @@
+import numpy as np
+
+
+class FeeSchedule:
+    """Maker/taker fees tiered by 30-day traded volume, plus a profit tax.
+
+    Every method accepts scalars or arrays, so live trades and whole
+    backtests go through the same formulas: fee = notional * rate and
+    tax = tax_rate * max(profit, 0).
+    """
+
+    def __init__(self, tiers=((0, 0.0001, 0.0001),), tax_rate=0.0):
+        """
+        Args:
+            tiers: (min_volume_30d, maker_rate, taker_rate) rows; the row with
+                the highest min_volume_30d not above the volume applies
+            tax_rate: Tax on positive realized profit per closed trade
+        """
+        tiers = sorted(tiers)
+        if not tiers or tiers[0][0] > 0:
+            raise ValueError("tiers must start at a volume of 0")
+        self.tiers = tuple(tuple(tier) for tier in tiers)
+        self.tax_rate = tax_rate
+        self._min_volume = np.array([tier[0] for tier in tiers], dtype=np.float64)
+        self._maker = np.array([tier[1] for tier in tiers], dtype=np.float64)
+        self._taker = np.array([tier[2] for tier in tiers], dtype=np.float64)
+
+    @classmethod
+    def flat(cls, rate=0.0001, tax_rate=0.0):
+        """Single-tier schedule charging `rate` to makers and takers alike"""
+        return cls(((0, rate, rate),), tax_rate)
+
+    def rate(self, volume_30d=0, maker=False):
+        """Fee rate(s) for the given 30-day volume(s) and liquidity side(s)"""
+        tier = np.searchsorted(self._min_volume, volume_30d, side="right") - 1
+        rates = np.where(maker, self._maker[tier], self._taker[tier])
+        return rates.item() if rates.ndim == 0 else rates
+
+    def fee(self, notional, volume_30d=0, maker=False):
+        """Fee(s) on traded notional(s)"""
+        if len(self.tiers) == 1 and np.ndim(notional) == 0:
+            # Single tier: skip the lookup on the per-trade live path
+            return notional * (self.tiers[0][1] if maker else self.tiers[0][2])
+        return notional * self.rate(volume_30d, maker)
+
+    def tax(self, profit):
+        """Tax owed on realized profit(s); losses are not taxed"""
+        if np.ndim(profit) == 0:
+            return self.tax_rate * profit if profit > 0 else 0.0
+        return self.tax_rate * np.maximum(profit, 0.0)
+
+    def settle(
+        self,
+        investment,
+        buy_price,
+        sell_price,
+        volume_30d=0,
+        maker=False,
+        sell_volume_30d=None,
+    ):
+        """
+        Fees, taxes and net P&L of round trips (buy then sell), in batch.
+
+        Mirrors MovingAverageStrategy.execute_trade: the buy fee comes out of
+        the investment, the sell fee out of the gross proceeds, and tax out
+        of the remaining profit.
+
+        Args:
+            sell_price: May be shorter than buy_price; the remaining buys
+                are open positions and only get coins and buy_fee
+            volume_30d: Fee-tier volume(s) at the buys
+            sell_volume_30d: Fee-tier volume(s) at the sells (defaults to
+                volume_30d)
+
+        Returns:
+            Dict of arrays: coins, buy_fee (one per buy), gross_proceeds,
+            sell_fee, tax, net_proceeds, profit_loss (one per sell)
+        """
+        investment = np.asarray(investment, dtype=np.float64)
+        buy_price = np.asarray(buy_price, dtype=np.float64)
+        sell_price = np.asarray(sell_price, dtype=np.float64)
+        if sell_volume_30d is None:
+            sell_volume_30d = volume_30d
+        buy_fee = self.fee(investment * np.ones_like(buy_price), volume_30d, maker)
+        coins = (investment - buy_fee) / buy_price
+        if buy_price.ndim:
+            closed = len(sell_price)
+            sold_coins = coins[:closed]
+            if investment.ndim:
+                investment = investment[:closed]
+        else:
+            sold_coins = coins
+        gross_proceeds = sold_coins * sell_price
+        sell_fee = self.fee(gross_proceeds, sell_volume_30d, maker)
+        tax = self.tax(gross_proceeds - sell_fee - investment)
+        net_proceeds = gross_proceeds - sell_fee - tax
+        return {
+            "coins": coins,
+            "buy_fee": buy_fee,
+            "gross_proceeds": gross_proceeds,
+            "sell_fee": sell_fee,
+            "tax": tax,
+            "net_proceeds": net_proceeds,
+            "profit_loss": net_proceeds - investment,
+        }
+
+
 def calculate_net_profit(initial_balance, trades, fee, tax):
-    """Calculate net profit after fees and taxes."""
-    balance = initial_balance
-    for trade in trades:
-        action, price = trade["action"], trade["price"]
-        if action == "buy":
-            balance -= price + price * fee
-        elif action == "sell":
-            balance += price - price * (fee + tax)
-    return balance - initial_balance
+    """
+    Calculate net profit after fees and taxes.
+
+    initial_balance is not used; it is kept so existing callers keep
+    working.
+    """
+    if not trades:
+        return 0
+    actions = np.array([trade["action"] for trade in trades])
+    prices = np.array([trade["price"] for trade in trades], dtype=np.float64)
+    return calculate_net_profit_batch(actions, prices, fee, tax)
+
+
+def calculate_net_profit_batch(actions, prices, fee, tax):
+    """Vectorized calculate_net_profit over action/price arrays"""
+    actions = np.asarray(actions)
+    prices = np.asarray(prices, dtype=np.float64)
+    cash_flow = np.where(
+        actions == "buy",
+        -(prices + prices * fee),
+        np.where(actions == "sell", prices - prices * (fee + tax), 0.0),
+    )
+    return float(cash_flow.sum())